@@ -0,0 +1,183 @@
+"""prompt_toolkit pieces for the interactive REPL (completion, history, style).
+
+Kept separate from ``repl`` so prompt_toolkit is only imported when the REPL
+actually starts prompting.
+"""
+
+from __future__ import annotations
+
+import os
+
+from prompt_toolkit.completion import Completer, Completion
+from prompt_toolkit.history import FileHistory
+from prompt_toolkit.styles import Style
+
+# REPL prompt style for prompt_toolkit
+PROMPT_STYLE = Style.from_dict(
+    {
+        "prompt": "ansicyan bold",
+        "model": "ansiblue",
+        "mode": "ansimagenta",
+        "rprompt": "ansigray",
+    }
+)
+
+# Available commands for completion
+COMMANDS = [
+    "/help",
+    "/exit",
+    "/quit",
+    "/clear",
+    "/model",
+    "/config",
+    "/skill",
+    "/skills",
+    "/memory",
+    "/learned",
+    "/project",
+    "/thinking",
+    "/autonomous",
+    "/personality",
+    "/verbose",
+    "/trust",
+    "/timeout",
+    "/status",
+    "/compact",
+    "/history",
+    "/context",
+    "/logs",
+    "/cd",
+    "/view",
+    "/commit",
+    "/branch",
+    "/git",
+]
+
+# Context subcommands for completion
+CONTEXT_COMMANDS = ["refresh", "note", "log", "issue", "save", "show"]
+
+# Memory subcommands for completion
+MEMORY_COMMANDS = ["on", "off", "stats", "decay"]
+
+# Project memory subcommands
+PROJECT_COMMANDS = ["list", "add", "search"]
+
+CONFIG_KEYS = [
+    "model",
+    "memory",
+    "thinking",
+    "autonomous",
+    "personality",
+    "personality.name",
+    "verbose",
+    "trust",
+    "timeout",
+    "retries",
+    "save",
+]
+
+MODEL_ALIASES = ["fast", "smart", "opus", "haiku", "sonnet", "best"]
+
+# Startup limits for loading REPL history
+HISTORY_MAX_ENTRIES = 5000
+HISTORY_MAX_BYTES = 1_000_000
+
+
+class TailFileHistory(FileHistory):
+    """FileHistory that only loads the most recent entries.
+
+    Large history files are read from the tail (at most ``max_bytes``) so
+    startup cost does not grow with total history length.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        max_entries: int = HISTORY_MAX_ENTRIES,
+        max_bytes: int = HISTORY_MAX_BYTES,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        super().__init__(filename)
+
+    def load_history_strings(self) -> list[str]:
+        try:
+            with open(self.filename, "rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                f.seek(max(0, size - self.max_bytes))
+                data = f.read()
+        except OSError:
+            return []
+
+        truncated = size > self.max_bytes
+        strings: list[str] = []
+        lines: list[str] = []
+
+        for line_bytes in data.splitlines(keepends=True):
+            line = line_bytes.decode("utf-8", errors="replace")
+            if line.startswith("+"):
+                lines.append(line[1:])
+                continue
+            # First entry boundary after seeking; drop the partial entry before it
+            if truncated:
+                truncated = False
+                lines = []
+                continue
+            if lines:
+                strings.append("".join(lines)[:-1])
+            lines = []
+
+        if lines and not truncated:
+            strings.append("".join(lines)[:-1])
+
+        # Newest items go first
+        strings.reverse()
+        return strings[: self.max_entries]
+
+
+class REPLCompleter(Completer):
+    """Custom completer for REPL commands."""
+
+    def get_completions(self, document, complete_event):
+        text = document.text_before_cursor
+        words = text.split()
+
+        if not text or text == "/":
+            # Complete commands
+            for cmd in COMMANDS:
+                if cmd.startswith(text):
+                    yield Completion(cmd, start_position=-len(text))
+
+        elif text.startswith("/config "):
+            # Complete config keys
+            partial = words[-1] if len(words) > 1 else ""
+            for key in CONFIG_KEYS:
+                if key.startswith(partial):
+                    yield Completion(key, start_position=-len(partial))
+
+        elif text.startswith("/model "):
+            # Complete model aliases
+            partial = words[-1] if len(words) > 1 else ""
+            for alias in MODEL_ALIASES:
+                if alias.startswith(partial):
+                    yield Completion(alias, start_position=-len(partial))
+
+        elif text.startswith("/context "):
+            # Complete context subcommands
+            partial = words[-1] if len(words) > 1 else ""
+            for subcmd in CONTEXT_COMMANDS:
+                if subcmd.startswith(partial):
+                    yield Completion(subcmd, start_position=-len(partial))
+
+        elif text.startswith("/memory "):
+            # Complete memory subcommands
+            partial = words[-1] if len(words) > 1 else ""
+            for subcmd in MEMORY_COMMANDS:
+                if subcmd.startswith(partial):
+                    yield Completion(subcmd, start_position=-len(partial))
+
+        elif text.startswith("/"):
+            # Complete partial commands
+            for cmd in COMMANDS:
+                if cmd.startswith(text):
+                    yield Completion(cmd, start_position=-len(text))
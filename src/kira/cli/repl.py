@@ -4,9 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import os
+import queue
+import stat
 import sys
+import threading
 import time
 import warnings
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -14,10 +19,6 @@ from typing import TYPE_CHECKING
 # These occur during Ctrl+C interrupts but don't affect functionality
 warnings.filterwarnings("ignore", message=".*Event loop is closed.*")
 
-from prompt_toolkit import PromptSession
-from prompt_toolkit.completion import Completer, Completion
-from prompt_toolkit.history import FileHistory
-from prompt_toolkit.styles import Style
 from rich.box import ROUNDED
 from rich.console import Console, Group
 from rich.live import Live
@@ -38,7 +39,7 @@ from ..memory.store import MemoryStore
 from ..skills.manager import SkillManager
 
 if TYPE_CHECKING:
-    pass
+    from prompt_toolkit import PromptSession
 
 # Theme colors
 COLORS = {
@@ -51,119 +52,8 @@ COLORS = {
     "accent": "magenta",
 }
 
-# REPL prompt style for prompt_toolkit
-PROMPT_STYLE = Style.from_dict(
-    {
-        "prompt": "ansicyan bold",
-        "model": "ansiblue",
-        "mode": "ansimagenta",
-        "rprompt": "ansigray",
-    }
-)
-
-# Available commands for completion
-COMMANDS = [
-    "/help",
-    "/exit",
-    "/quit",
-    "/clear",
-    "/model",
-    "/config",
-    "/skill",
-    "/skills",
-    "/memory",
-    "/learned",
-    "/project",
-    "/thinking",
-    "/autonomous",
-    "/personality",
-    "/verbose",
-    "/trust",
-    "/timeout",
-    "/status",
-    "/compact",
-    "/history",
-    "/context",
-    "/logs",
-    "/cd",
-    "/view",
-    "/commit",
-    "/branch",
-    "/git",
-]
-
-# Context subcommands for completion
-CONTEXT_COMMANDS = ["refresh", "note", "log", "issue", "save", "show"]
-
-# Memory subcommands for completion
-MEMORY_COMMANDS = ["on", "off", "stats", "decay"]
-
-# Project memory subcommands
-PROJECT_COMMANDS = ["list", "add", "search"]
-
-CONFIG_KEYS = [
-    "model",
-    "memory",
-    "thinking",
-    "autonomous",
-    "personality",
-    "personality.name",
-    "verbose",
-    "trust",
-    "timeout",
-    "retries",
-    "save",
-]
-
-MODEL_ALIASES = ["fast", "smart", "opus", "haiku", "sonnet", "best"]
-
-
-class REPLCompleter(Completer):
-    """Custom completer for REPL commands."""
-
-    def get_completions(self, document, complete_event):
-        text = document.text_before_cursor
-        words = text.split()
-
-        if not text or text == "/":
-            # Complete commands
-            for cmd in COMMANDS:
-                if cmd.startswith(text):
-                    yield Completion(cmd, start_position=-len(text))
-
-        elif text.startswith("/config "):
-            # Complete config keys
-            partial = words[-1] if len(words) > 1 else ""
-            for key in CONFIG_KEYS:
-                if key.startswith(partial):
-                    yield Completion(key, start_position=-len(partial))
-
-        elif text.startswith("/model "):
-            # Complete model aliases
-            partial = words[-1] if len(words) > 1 else ""
-            for alias in MODEL_ALIASES:
-                if alias.startswith(partial):
-                    yield Completion(alias, start_position=-len(partial))
-
-        elif text.startswith("/context "):
-            # Complete context subcommands
-            partial = words[-1] if len(words) > 1 else ""
-            for subcmd in CONTEXT_COMMANDS:
-                if subcmd.startswith(partial):
-                    yield Completion(subcmd, start_position=-len(partial))
-
-        elif text.startswith("/memory "):
-            # Complete memory subcommands
-            partial = words[-1] if len(words) > 1 else ""
-            for subcmd in MEMORY_COMMANDS:
-                if subcmd.startswith(partial):
-                    yield Completion(subcmd, start_position=-len(partial))
-
-        elif text.startswith("/"):
-            # Complete partial commands
-            for cmd in COMMANDS:
-                if cmd.startswith(text):
-                    yield Completion(cmd, start_position=-len(text))
+# Verbose-mode response duration line
+_DURATION_FMT = f"[{COLORS['muted']}]({{:.1f}}s)[/]"
 
 
 class InteractiveREPL:
@@ -197,6 +87,12 @@ class InteractiveREPL:
         self.log_store = RunLogStore()
         self.run_id: int | None = None
 
+        # Run-log updates and memory extraction run on a background thread so
+        # the DB writes do not delay the next prompt
+        self._log_queue: queue.Queue[Callable[[], object]] = queue.Queue(maxsize=256)
+        threading.Thread(target=self._log_worker, name="kira-log-writer", daemon=True).start()
+        self._pending_memories: Future[int] | None = None
+
         # Project context manager
         self.context_manager = ContextManager(Path.cwd())
 
@@ -249,10 +145,15 @@ class InteractiveREPL:
 
         return parts
 
-    def _check_for_updates(self) -> None:
-        """Check for kiro-cli updates and show reminder if needed."""
+    def _check_for_updates(self, pending: Future[dict | None] | None = None) -> None:
+        """Check for kiro-cli updates and show reminder if needed.
+
+        Args:
+            pending: Optional in-flight ``KiraClient.check_for_updates`` call
+                to take the result from instead of checking synchronously.
+        """
         try:
-            result = KiraClient.check_for_updates()
+            result = pending.result() if pending else KiraClient.check_for_updates()
             if result and result.get("should_remind") and result.get("message"):
                 self.console.print(f"[{COLORS['warning']}]! {result['message']}[/]")
                 self.console.print()
@@ -1491,8 +1392,6 @@ class InteractiveREPL:
 
     def _change_directory(self, args: str) -> None:
         """Change the working directory."""
-        import os
-
         if not args:
             # Show current directory
             self.console.print(f"[{COLORS['primary']}]Working directory:[/] {Path.cwd()}")
@@ -1505,11 +1404,14 @@ class InteractiveREPL:
             new_path = Path.cwd() / new_path
         new_path = new_path.resolve()
 
-        if not new_path.exists():
+        # Single stat covers both the existence and directory checks
+        try:
+            st = os.stat(new_path)
+        except OSError:
             self._print_error(f"Directory not found: {new_path}")
             return
 
-        if not new_path.is_dir():
+        if not stat.S_ISDIR(st.st_mode):
             self._print_error(f"Not a directory: {new_path}")
             return
 
@@ -1737,12 +1639,71 @@ class InteractiveREPL:
             self._print_warning(f"Unknown logs command: {subcmd}")
             self.console.print(f"[{COLORS['muted']}]Available: stats, current[/]")
 
+    def _log_worker(self) -> None:
+        """Run queued background jobs (run-log updates, memory extraction)."""
+        while True:
+            job = self._log_queue.get()
+            try:
+                job()
+            except Exception:
+                pass  # Background bookkeeping must never break the REPL
+            finally:
+                self._log_queue.task_done()
+
+    def _run_in_background(self, job: Callable[[], object]) -> None:
+        """Queue a job for the background worker, running inline if the queue is full."""
+        try:
+            self._log_queue.put_nowait(job)
+        except queue.Full:
+            job()
+
+    def _log_response(self, entry_id: int, output: str, duration: float) -> None:
+        """Queue a run-log response update."""
+        self._run_in_background(
+            lambda: self.log_store.update_entry_response(entry_id, output, duration)
+        )
+
+    def _save_memories(self, session_manager: SessionManager, output: str, prompt: str) -> None:
+        """Queue memory extraction for a response.
+
+        The saved count is reported (in verbose mode) once the job is done, at
+        the start of the next message or on exit.
+        """
+        future: Future[int] = Future()
+
+        def job() -> None:
+            try:
+                future.set_result(
+                    session_manager.save_memories(
+                        output,
+                        prompt=prompt,  # Pass prompt for context-aware extraction
+                        auto_extract=True,
+                    )
+                )
+            except Exception as e:
+                future.set_exception(e)
+
+        self._pending_memories = future
+        self._run_in_background(job)
+
+    def _report_saved_memories(self) -> None:
+        """Show how many memories the last finished extraction saved."""
+        future = self._pending_memories
+        if future is None or not future.done():
+            return
+
+        self._pending_memories = None
+        if future.exception() is None and future.result() > 0 and self.verbose:
+            self.console.print(f"[{COLORS['muted']}]Learned {future.result()} things[/]")
+
     def _show_goodbye(self) -> None:
         """Show goodbye message."""
         elapsed = int(time.time() - self.session_start)
         mins, secs = divmod(elapsed, 60)
 
-        # End the run log
+        # Flush pending background work, then end the run log
+        self._log_queue.join()
+        self._report_saved_memories()
         if self.run_id:
             self.log_store.end_run(self.run_id)
 
@@ -1796,8 +1757,10 @@ class InteractiveREPL:
         """Send a message and display formatted response."""
         from .formatter import OutputFormatter
 
+        self._report_saved_memories()
+
         self.message_count += 1
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         # Log the entry
         entry_id = None
@@ -1839,8 +1802,8 @@ class InteractiveREPL:
             self.console.print()
             self._print_warning("Interrupted")
             if entry_id:
-                duration = time.time() - start_time
-                self.log_store.update_entry_response(entry_id, "".join(collected), duration)
+                duration = (time.monotonic_ns() - start_ns) / 1e9
+                self._log_response(entry_id, "".join(collected), duration)
             # Give subprocess time to clean up
             await asyncio.sleep(0.1)
             return
@@ -1867,26 +1830,20 @@ class InteractiveREPL:
             formatter.format(full_output)
 
         # Show duration in verbose mode
-        duration = time.time() - start_time
+        duration = (time.monotonic_ns() - start_ns) / 1e9
         if self.verbose and duration > 0:
             self.console.print()
-            self.console.print(f"[{COLORS['muted']}]({duration:.1f}s)[/]")
+            self.console.print(_DURATION_FMT.format(duration))
 
         self.console.print()  # Final spacing
 
         # Log the response
         if entry_id:
-            self.log_store.update_entry_response(entry_id, full_output, duration)
+            self._log_response(entry_id, full_output, duration)
 
         # Extract memories (explicit markers + auto-extraction)
         if not self.no_memory and self.config.memory.auto_extract:
-            saved = session_manager.save_memories(
-                full_output,
-                prompt=prompt,  # Pass prompt for context-aware extraction
-                auto_extract=True,
-            )
-            if saved > 0 and self.verbose:
-                self.console.print(f"[{COLORS['muted']}]Learned {saved} things[/]")
+            self._save_memories(session_manager, full_output, prompt)
 
         # Autonomous mode: verify and self-correct if needed
         if self.config.autonomous.enabled:
@@ -1999,17 +1956,16 @@ Please fix these issues. Show only the corrected code/solution."""
         """Get the working directory, falling back to default if needed."""
         cwd = Path.cwd()
 
-        # Check if we're in a meaningful directory (has files or is a git repo)
-        has_content = any(cwd.iterdir()) if cwd.exists() else False
-        is_git_repo = (cwd / ".git").exists()
-        is_project = (
-            (cwd / ".kira").exists()
-            or (cwd / "pyproject.toml").exists()
-            or (cwd / "package.json").exists()
-        )
+        # A directory with any entry is meaningful; project markers such as
+        # .git, .kira or pyproject.toml are entries too, so one dirent suffices
+        try:
+            with os.scandir(cwd) as it:
+                has_content = next(it, None) is not None
+        except OSError:
+            has_content = False
 
         # If current directory seems valid, use it
-        if has_content or is_git_repo or is_project:
+        if has_content:
             return cwd
 
         # Fall back to configured default
@@ -2024,7 +1980,14 @@ Please fix these issues. Show only the corrected code/solution."""
     def run(self) -> None:
         """Run the interactive REPL."""
         self._show_welcome()
-        self._check_for_updates()
+
+        # Independent startup I/O runs in the background while the rest of
+        # the session is set up
+        startup_pool = ThreadPoolExecutor(max_workers=3)
+        pending_updates = startup_pool.submit(KiraClient.check_for_updates)
+        pending_memory = startup_pool.submit(MemoryStore)
+        pending_skills = startup_pool.submit(SkillManager)
+        startup_pool.shutdown(wait=False)
 
         # Determine working directory
         work_dir = self._get_working_dir()
@@ -2033,8 +1996,8 @@ Please fix these issues. Show only the corrected code/solution."""
             self.console.print()
 
         # Initialize components
-        memory_store = MemoryStore()
-        skill_manager = SkillManager()
+        memory_store = pending_memory.result()
+        skill_manager = pending_skills.result()
         session_manager = SessionManager(memory_store, skill_manager)
 
         # Resolve model
@@ -2076,9 +2039,16 @@ Please fix these issues. Show only the corrected code/solution."""
             self._print_error(str(e))
             sys.exit(1)
 
-        # Create prompt session with history and completion
+        self._check_for_updates(pending_updates)
+
+        # Create prompt session with history and completion. prompt_toolkit is
+        # only imported here so importing this module stays cheap.
+        from prompt_toolkit import PromptSession
+
+        from .prompt import PROMPT_STYLE, REPLCompleter, TailFileHistory
+
         prompt_session: PromptSession[str] = PromptSession(
-            history=FileHistory(str(self.history_file)),
+            history=TailFileHistory(str(self.history_file)),
             style=PROMPT_STYLE,
             completer=REPLCompleter(),
             complete_while_typing=False,
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import fnmatch
 import os
+import re
+import subprocess
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -57,30 +61,85 @@ TECH_PATTERNS: dict[str, dict[str, list[str]]] = {
     },
 }
 
-# Ignore patterns
-IGNORE_DIRS = {
-    ".git",
-    ".svn",
-    ".hg",
-    "node_modules",
-    "__pycache__",
-    ".venv",
-    "venv",
-    "env",
-    ".env",
-    "dist",
-    "build",
-    ".next",
-    ".nuxt",
-    "target",
-    "vendor",
-    ".idea",
-    ".vscode",
-    ".kira",
-    "coverage",
-    ".pytest_cache",
-    ".mypy_cache",
+# File extension -> language, for counting files per language
+LANG_EXTENSIONS: dict[str, list[str]] = {
+    "Python": [".py"],
+    "JavaScript": [".js", ".jsx", ".mjs"],
+    "TypeScript": [".ts", ".tsx"],
+    "Java": [".java"],
+    "Go": [".go"],
+    "Rust": [".rs"],
+    "Ruby": [".rb"],
+    "PHP": [".php"],
+    "C#": [".cs"],
 }
+EXT_TO_LANG = {ext: lang for lang, exts in LANG_EXTENSIONS.items() for ext in exts}
+
+TechKey = tuple[str, str]  # (category, tech name)
+
+
+def _index_tech_patterns() -> tuple[
+    dict[str, list[TechKey]],
+    dict[str, list[TechKey]],
+    list[tuple[re.Pattern[str], list[TechKey]]],
+    list[tuple[str, str, TechKey]],
+]:
+    """Invert TECH_PATTERNS into lookup tables keyed by pattern kind."""
+    exact: dict[str, list[TechKey]] = {}
+    dirs: dict[str, list[TechKey]] = {}
+    globs: dict[str, list[TechKey]] = {}
+    content: list[tuple[str, str, TechKey]] = []
+
+    for category, techs in TECH_PATTERNS.items():
+        for tech_name, patterns in techs.items():
+            key = (category, tech_name)
+            for pattern in patterns:
+                if ":" in pattern:
+                    file_pattern, needle = pattern.split(":", 1)
+                    content.append((file_pattern, needle, key))
+                elif pattern.endswith("/"):
+                    dirs.setdefault(pattern[:-1], []).append(key)
+                elif "*" in pattern:
+                    globs.setdefault(pattern, []).append(key)
+                else:
+                    exact.setdefault(pattern, []).append(key)
+
+    compiled = [(re.compile(fnmatch.translate(p)), keys) for p, keys in globs.items()]
+    return exact, dirs, compiled, content
+
+
+# Precomputed dispatch tables for _detect_tech_stack
+_EXACT_TO_TECHS, _DIR_TO_TECHS, _GLOB_TO_TECHS, _CONTENT_TO_TECHS = _index_tech_patterns()
+
+# Ignore patterns
+IGNORE_DIRS: frozenset[str] = frozenset(
+    {
+        ".git",
+        ".svn",
+        ".hg",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        "env",
+        ".env",
+        "dist",
+        "build",
+        ".next",
+        ".nuxt",
+        "target",
+        "vendor",
+        ".idea",
+        ".vscode",
+        ".kira",
+        "coverage",
+        ".pytest_cache",
+        ".mypy_cache",
+    }
+)
+
+# Dot-directories are skipped by the file scan, except these
+SCANNED_DOT_DIRS: frozenset[str] = frozenset({".github", ".gitlab"})
 
 IGNORE_FILES = {
     ".DS_Store",
@@ -95,6 +154,63 @@ IGNORE_FILES = {
     "poetry.lock",
 }
 
+# Entry points and config files looked for in _analyze_structure
+ENTRY_POINT_PATTERNS = [
+    "main.py",
+    "app.py",
+    "index.py",
+    "__main__.py",
+    "index.js",
+    "index.ts",
+    "main.js",
+    "main.ts",
+    "src/main.*",
+    "src/index.*",
+    "src/app.*",
+]
+CONFIG_PATTERNS = [
+    "*.yaml",
+    "*.yml",
+    "*.json",
+    "*.toml",
+    "*.ini",
+    "*.cfg",
+    ".env*",
+    "Makefile",
+    "Dockerfile",
+]
+
+# (parent dir, compiled name pattern) pairs, in pattern order
+_ENTRY_POINT_RES = [
+    (parent, re.compile(fnmatch.translate(name)))
+    for parent, _, name in (p.rpartition("/") for p in ENTRY_POINT_PATTERNS)
+]
+_CONFIG_FILE_RES = [re.compile(fnmatch.translate(p)) for p in CONFIG_PATTERNS]
+
+# All IGNORE_FILES patterns (globs and literal names) as one compiled union
+_IGNORE_FILE_RE = re.compile("|".join(fnmatch.translate(p) for p in sorted(IGNORE_FILES)))
+
+
+def _skip_dir(name: str) -> bool:
+    """Whether the file scan should not descend into a directory."""
+    if name.startswith("."):
+        return name not in SCANNED_DOT_DIRS
+    return name in IGNORE_DIRS
+
+
+# Content checks only look at the start of a file; dependency names live there
+MAX_CONTENT_BYTES = 256 * 1024
+
+
+def _read_lower(path: str) -> str:
+    """Read a file's first MAX_CONTENT_BYTES as lowercased text ("" if unreadable)."""
+    try:
+        with open(path, "rb") as f:
+            blob = f.read(MAX_CONTENT_BYTES)
+        return blob.decode("utf-8", "ignore").lower()
+    except Exception:
+        return ""
+
 
 @dataclass
 class AnalysisResult:
@@ -114,10 +230,18 @@ class ProjectAnalyzer:
 
     def __init__(self, project_dir: Path | None = None):
         self.project_dir = project_dir or Path.cwd()
-        self._file_cache: list[Path] = []
+        # Scanned files as parallel arrays: name, lowercased suffix, dir relative
+        # to project_dir ("" for the root)
+        self._names: list[str] = []
+        self._suffixes: list[str] = []
+        self._rel_dirs: list[str] = []
+        self._contents: dict[str, str] = {}
 
     def analyze(self) -> AnalysisResult:
         """Perform full project analysis."""
+        # Drop file contents cached by a previous run
+        self._contents = {}
+
         # Scan files
         self._scan_files()
 
@@ -139,7 +263,7 @@ class ProjectAnalyzer:
         return AnalysisResult(
             project_name=self.project_dir.name,
             tech_stack=tech_stack,
-            file_count=len(self._file_cache),
+            file_count=len(self._names),
             primary_language=primary_language,
             structure=structure,
             conventions=conventions,
@@ -159,85 +283,186 @@ class ProjectAnalyzer:
         )
 
     def _scan_files(self) -> None:
-        """Scan project for files."""
-        self._file_cache = []
-
-        for root, dirs, files in os.walk(self.project_dir):
-            # Filter ignored directories
-            dirs[:] = [d for d in dirs if d not in IGNORE_DIRS]
+        """Scan project for files.
+
+        Uses ``git ls-files`` when the project is a git checkout, falling back
+        to walking the tree with ``os.scandir``.
+        """
+        self._names = []
+        self._suffixes = []
+        self._rel_dirs = []
+
+        if not self._git_files():
+            self._walk_files()
+
+    def _add_file(self, rel_dir: str, name: str) -> None:
+        """Record a scanned file."""
+        self._names.append(name)
+        self._suffixes.append(os.path.splitext(name)[1].lower())
+        self._rel_dirs.append(rel_dir)
+
+    def _file_path(self, index: int) -> str:
+        """Absolute path of the scanned file at ``index``."""
+        return os.path.join(self.project_dir, self._rel_dirs[index], self._names[index])
+
+    def _git_files(self) -> bool:
+        """List tracked and untracked-but-not-ignored files via git."""
+        if not (self.project_dir / ".git").exists():
+            return False
+
+        try:
+            result = subprocess.run(
+                [
+                    "git",
+                    "-C",
+                    str(self.project_dir),
+                    "ls-files",
+                    "-co",
+                    "--exclude-standard",
+                    "-z",
+                ],
+                capture_output=True,
+                check=True,
+                timeout=2,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return False
+
+        for raw in result.stdout.split(b"\0"):
+            if not raw:
+                continue
+            rel_dir, _, name = os.fsdecode(raw).rpartition("/")
+            # Apply the same ignore rules as the directory walk
+            if rel_dir and any(_skip_dir(part) for part in rel_dir.split("/")):
+                continue
+            if _IGNORE_FILE_RE.match(name):
+                continue
+            self._add_file(rel_dir, name)
+
+        return True
+
+    def _walk_files(self) -> None:
+        """Walk the project tree with ``os.scandir``.
+
+        Directory/file checks reuse the type information from the directory
+        read instead of extra ``stat`` calls.
+        """
+        root = os.fspath(self.project_dir)
+        stack = [""]
+
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                with os.scandir(os.path.join(root, rel_dir)) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in entries:
+                name = entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if is_dir:
+                    # Do not descend into symlinked directories (os.walk default)
+                    if not _skip_dir(name) and not entry.is_symlink():
+                        subdirs.append(f"{rel_dir}/{name}" if rel_dir else name)
+                    continue
 
-            root_path = Path(root)
-            for file in files:
                 # Skip ignored files
-                if any(file.endswith(p.replace("*", "")) for p in IGNORE_FILES if "*" in p):
-                    continue
-                if file in IGNORE_FILES:
+                if _IGNORE_FILE_RE.match(name):
                     continue
 
-                self._file_cache.append(root_path / file)
+                self._add_file(rel_dir, name)
+
+            # Preserve top-down directory order when popping from the stack
+            stack.extend(reversed(subdirs))
 
     def _detect_tech_stack(self) -> TechStack:
-        """Detect technologies used in the project."""
-        stack = TechStack()
-
-        for category, techs in TECH_PATTERNS.items():
-            detected = self._detect_category(techs)
-            if category == "languages":
-                stack.languages = detected
-            elif category == "frameworks":
-                stack.frameworks = detected
-            elif category == "databases":
-                stack.databases = detected
-            elif category == "tools":
-                stack.tools = detected
-
-        return stack
-
-    def _detect_category(self, techs: dict[str, list[str]]) -> list[str]:
-        """Detect technologies in a category."""
-        detected = []
+        """Detect technologies used in the project.
+
+        Makes a single pass over the scanned files against the precompiled
+        glob table instead of rescanning the file list for every pattern.
+        """
+        found: set[TechKey] = set()
+
+        # Exact files and directories at the project root
+        for name, keys in _EXACT_TO_TECHS.items():
+            if (self.project_dir / name).exists():
+                found.update(keys)
+        for name, keys in _DIR_TO_TECHS.items():
+            if (self.project_dir / name).is_dir():
+                found.update(keys)
+
+        # Glob patterns, one pass over file names
+        pending = [(regex, keys) for regex, keys in _GLOB_TO_TECHS if not found.issuperset(keys)]
+        for name in self._names:
+            if not pending:
+                break
+            matched = [item for item in pending if item[0].match(name)]
+            if matched:
+                for item in matched:
+                    found.update(item[1])
+                    pending.remove(item)
+
+        # Content patterns only for techs not already detected
+        content_checks = [item for item in _CONTENT_TO_TECHS if item[2] not in found]
+        self._prefetch_contents({file_pattern for file_pattern, _, _ in content_checks})
+        for file_pattern, needle, key in content_checks:
+            if key not in found and self._check_file_content(file_pattern, needle):
+                found.add(key)
+
+        detected = {
+            category: [tech for tech in techs if (category, tech) in found]
+            for category, techs in TECH_PATTERNS.items()
+        }
+        return TechStack(
+            languages=detected["languages"],
+            frameworks=detected["frameworks"],
+            databases=detected["databases"],
+            tools=detected["tools"],
+        )
 
-        for tech_name, patterns in techs.items():
-            if self._matches_patterns(patterns):
-                detected.append(tech_name)
-
-        return detected
-
-    def _matches_patterns(self, patterns: list[str]) -> bool:
-        """Check if any pattern matches project files."""
-        for pattern in patterns:
-            # Pattern with file content check
-            if ":" in pattern:
-                file_pattern, content = pattern.split(":", 1)
-                if self._check_file_content(file_pattern, content):
-                    return True
-            # Directory pattern
-            elif pattern.endswith("/"):
-                dir_name = pattern[:-1]
-                if (self.project_dir / dir_name).is_dir():
-                    return True
-            # Glob pattern
-            elif "*" in pattern:
-                if any(f.match(pattern) for f in self._file_cache):
-                    return True
-            # Exact file
-            else:
-                if (self.project_dir / pattern).exists():
-                    return True
+    def _prefetch_contents(self, file_patterns: set[str]) -> None:
+        """Read the root manifests named by content-check patterns in parallel.
 
-        return False
+        Deeper and wildcard-matched files are only read on demand by
+        ``_check_file_content``.
+        """
+        paths = {
+            self._file_path(i)
+            for i, name in enumerate(self._names)
+            if not self._rel_dirs[i] and name in file_patterns
+        }
+        paths.difference_update(self._contents)
+        if not paths:
+            return
+
+        ordered = sorted(paths)
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(ordered))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            self._contents.update(zip(ordered, pool.map(_read_lower, ordered), strict=True))
 
     def _check_file_content(self, file_pattern: str, content: str) -> bool:
         """Check if a file contains specific content."""
+        needle = content.lower()
+        # Named manifests are probed for several needles, so keep them for
+        # this analysis; wildcard matches (e.g. every *.yaml) are read once
+        keep = "*" not in file_pattern
         # Find matching files
-        for file_path in self._file_cache:
-            if file_path.match(file_pattern) or file_path.name == file_pattern:
-                try:
-                    file_content = file_path.read_text(errors="ignore")
-                    if content.lower() in file_content.lower():
-                        return True
-                except Exception:
-                    pass
+        for i, name in enumerate(self._names):
+            if fnmatch.fnmatchcase(name, file_pattern):
+                path = self._file_path(i)
+                text = self._contents.get(path)
+                if text is None:
+                    text = _read_lower(path)
+                    if keep:
+                        self._contents[path] = text
+                if needle in text:
+                    return True
         return False
 
     def _analyze_structure(self) -> dict[str, Any]:
@@ -249,56 +474,54 @@ class ProjectAnalyzer:
             "config_files": [],
         }
 
+        # One directory read for the root (and src/) serves every pattern below
+        root_entries = self._list_dir(self.project_dir)
+        root_dirs = {name for name, is_dir in root_entries if is_dir}
+
         # Find top-level directories
-        for item in self.project_dir.iterdir():
-            if item.is_dir() and item.name not in IGNORE_DIRS:
-                structure["directories"].append(item.name)
+        for name, is_dir in root_entries:
+            if is_dir and name not in IGNORE_DIRS:
+                structure["directories"].append(name)
 
         # Find entry points
-        entry_point_patterns = [
-            "main.py",
-            "app.py",
-            "index.py",
-            "__main__.py",
-            "index.js",
-            "index.ts",
-            "main.js",
-            "main.ts",
-            "src/main.*",
-            "src/index.*",
-            "src/app.*",
-        ]
-        for pattern in entry_point_patterns:
-            matches = list(self.project_dir.glob(pattern))
-            for match in matches:
-                rel_path = match.relative_to(self.project_dir)
-                structure["entry_points"].append(str(rel_path))
+        listings = {"": root_entries}
+        if "src" in root_dirs:
+            listings["src"] = self._list_dir(self.project_dir / "src")
+        for parent, regex in _ENTRY_POINT_RES:
+            for name, _ in listings.get(parent, ()):
+                if regex.match(name):
+                    structure["entry_points"].append(f"{parent}/{name}" if parent else name)
 
         # Find test directories
         test_patterns = ["tests", "test", "spec", "__tests__"]
         for pattern in test_patterns:
-            if (self.project_dir / pattern).is_dir():
+            if pattern in root_dirs:
                 structure["test_dirs"].append(pattern)
 
         # Find config files
-        config_patterns = [
-            "*.yaml",
-            "*.yml",
-            "*.json",
-            "*.toml",
-            "*.ini",
-            "*.cfg",
-            ".env*",
-            "Makefile",
-            "Dockerfile",
-        ]
-        for pattern in config_patterns:
-            for match in self.project_dir.glob(pattern):
-                if match.is_file():
-                    structure["config_files"].append(match.name)
+        for regex in _CONFIG_FILE_RES:
+            for name, is_dir in root_entries:
+                if not is_dir and regex.match(name):
+                    structure["config_files"].append(name)
 
         return structure
 
+    @staticmethod
+    def _list_dir(path: Path) -> list[tuple[str, bool]]:
+        """List ``(name, is_dir)`` for the entries of a directory."""
+        entries = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    entries.append((entry.name, is_dir))
+        except OSError:
+            pass
+        return entries
+
     def _detect_conventions(self) -> list[Convention]:
         """Detect coding conventions from the project."""
         conventions = []
@@ -346,24 +569,10 @@ class ProjectAnalyzer:
             return "Unknown"
 
         # Count files by extension
-        ext_counts: Counter[str] = Counter()
-        lang_exts = {
-            "Python": [".py"],
-            "JavaScript": [".js", ".jsx", ".mjs"],
-            "TypeScript": [".ts", ".tsx"],
-            "Java": [".java"],
-            "Go": [".go"],
-            "Rust": [".rs"],
-            "Ruby": [".rb"],
-            "PHP": [".php"],
-            "C#": [".cs"],
-        }
-
-        for file_path in self._file_cache:
-            ext = file_path.suffix.lower()
-            for lang, exts in lang_exts.items():
-                if ext in exts and lang in tech_stack.languages:
-                    ext_counts[lang] += 1
+        langs_in_stack = set(tech_stack.languages)
+        ext_counts = Counter(
+            lang for suffix in self._suffixes if (lang := EXT_TO_LANG.get(suffix)) in langs_in_stack
+        )
 
         if ext_counts:
             return ext_counts.most_common(1)[0][0]
@@ -396,7 +605,7 @@ class ProjectAnalyzer:
             lines.append(f"Tests are located in `{test_dir}/`.")
 
         # File count
-        lines.append(f"Contains {len(self._file_cache)} source files.")
+        lines.append(f"Contains {len(self._names)} source files.")
 
         return " ".join(lines)
 
@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
+import contextlib
+import copy
+import functools
+import hashlib
+import io
 import os
 import re
+import subprocess
+import sys
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -21,6 +29,125 @@ from .models import (
 CONTEXT_FILE = ".kira/context.md"
 CHANGELOG_FILE = ".kira/changelog.md"
 
+# Parser patterns, compiled once at import
+_HEADER_RE = re.compile(r"#\s+(.+?)(?:\n|$)")
+_CHANGELOG_HEADER_RE = re.compile(
+    r"(\d{4}-\d{2}-\d{2})\s*(?:\d{2}:\d{2})?\s*-\s*(.+?)(?:\s*\[(\w+)\])?\s*(?:\(@(\w+)\))?$"
+)
+_CONVENTION_RE = re.compile(r"\*\*(.+?):\*\*\s*(.+)")
+_ISSUE_SEVERITY_RE = re.compile(r"\[(\w+)\]\s*(.+)")
+_MD_FMT_RE = re.compile(r"\*\*|\*|`")
+_SECTION_SPLIT_RE = re.compile(r"^##? (.*)$", re.MULTILINE)
+# Case-insensitive substring keywords for categorizing tech stack bullets
+_LANG_KEYWORD_RE = re.compile("python|javascript|typescript|java|go|rust", re.IGNORECASE)
+_FRAMEWORK_KEYWORD_RE = re.compile("react|vue|fastapi|django|spring", re.IGNORECASE)
+_DB_KEYWORD_RE = re.compile("postgres|mysql|mongodb|redis", re.IGNORECASE)
+# Inline "**Label:** a, b" tech stack lines and the TechStack field they fill
+_TECH_STACK_LABELS = {
+    "**Languages:**": "languages",
+    "**Frameworks:**": "frameworks",
+    "**Databases:**": "databases",
+    "**Tools:**": "tools",
+}
+_LAST_UPDATED_RE = re.compile(r"^\*Last updated: .*\*$", re.MULTILINE)
+_UPDATED_BY_RE = re.compile(r"^\*Updated by: @.*\*$", re.MULTILINE)
+
+# Changelog type tags -> ChangeType, avoiding a raising constructor per entry
+_CHANGE_TYPES = {member.value: member for member in ChangeType}
+
+# Markers used to splice a new change into an existing context file
+_RECENT_CHANGES_MARKER = "\n## Recent Changes\n\n"
+_NO_CHANGES_PLACEHOLDER = "*No changes recorded yet.*\n"
+# Number of changes rendered in the "Recent Changes" section
+_RECENT_CHANGES_LIMIT = 10
+
+# Parsed contexts keyed by a digest of the file contents (FIFO, bounded)
+_PARSE_CACHE: dict[bytes, ProjectContext] = {}
+_PARSE_CACHE_SIZE = 32
+# Last observed (st_mtime_ns, st_size, content digest) per context file, letting
+# load() skip reading and hashing a file that has not changed
+_STAT_CACHE: dict[Path, tuple[int, int, bytes]] = {}
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_user(project_dir: str) -> str:
+    """Resolve the user name for a project once per process.
+
+    Avoids spawning ``git config`` on every context mutation.
+    """
+    # Try git config first
+    try:
+        result = subprocess.run(
+            ["git", "config", "user.name"],
+            capture_output=True,
+            text=True,
+            cwd=project_dir,
+            timeout=1,
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    except Exception:
+        pass
+
+    # Fall back to environment
+    return os.environ.get("USER", os.environ.get("USERNAME", "unknown"))
+
+
+def _is_word(value: str) -> bool:
+    r"""Whole-string equivalent of ``\w+``."""
+    return value.replace("_", "a").isalnum()
+
+
+def _parse_changelog_header(header: str) -> tuple[str, str, str | None, str | None] | None:
+    """Split ``YYYY-MM-DD [HH:MM] - summary [type] (@author)`` into its fields.
+
+    Scans the rigid format with slicing; anything the scanner does not
+    recognise is handed to ``_CHANGELOG_HEADER_RE``.
+    """
+    date = header[:10]
+    rest = header[10:].lstrip()
+    if (
+        len(date) == 10
+        and date[4] == date[7] == "-"
+        and (date[:4] + date[5:7] + date[8:]).isdecimal()
+    ):
+        if rest[2:3] == ":" and (rest[:2] + rest[3:5]).isdecimal() and len(rest) >= 5:
+            rest = rest[5:].lstrip()
+        if rest.startswith("-"):
+            rest = rest[1:].lstrip()
+            author = change_type = None
+            if rest.endswith(")") and (i := rest.rfind("(@")) >= 0 and _is_word(rest[i + 2 : -1]):
+                author = rest[i + 2 : -1]
+                rest = rest[:i].rstrip()
+            if rest.endswith("]") and (i := rest.rfind("[")) >= 0 and _is_word(rest[i + 1 : -1]):
+                change_type = rest[i + 1 : -1]
+                rest = rest[:i].rstrip()
+            if rest:
+                return date, rest, change_type, author
+
+    if match := _CHANGELOG_HEADER_RE.match(header):
+        return match.group(1), match.group(2), match.group(3), match.group(4)
+    return None
+
+
+def _parse_ymd(value: str) -> datetime:
+    """Parse a ``YYYY-MM-DD`` date; raises ValueError when malformed."""
+    year, month, day = value.split("-")
+    return datetime(int(year), int(month), int(day))
+
+
+def _digest(data: bytes) -> bytes:
+    """Content key for the parse cache."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode file bytes with the universal-newline handling of ``read_text``."""
+    text = data.decode()
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
 
 class ContextManager:
     """Manages project context files."""
@@ -30,6 +157,7 @@ class ContextManager:
         self.context_path = self.project_dir / CONTEXT_FILE
         self.changelog_path = self.project_dir / CHANGELOG_FILE
         self._context: ProjectContext | None = None
+        self._batch_depth = 0
 
     @property
     def context(self) -> ProjectContext:
@@ -44,26 +172,76 @@ class ContextManager:
 
     def load(self) -> ProjectContext:
         """Load context from file."""
-        if not self.context_path.exists():
+        try:
+            st = self.context_path.stat()
+        except OSError:
             return ProjectContext()
 
-        content = self.context_path.read_text()
-        return self._parse_context(content)
+        seen = _STAT_CACHE.get(self.context_path)
+        if (
+            seen
+            and seen[:2] == (st.st_mtime_ns, st.st_size)
+            and (cached := _PARSE_CACHE.get(seen[2])) is not None
+        ):
+            return copy.deepcopy(cached)
+
+        data = self.context_path.read_bytes()
+        key = _digest(data)
+        _STAT_CACHE[self.context_path] = (st.st_mtime_ns, st.st_size, key)
+        if (cached := _PARSE_CACHE.get(key)) is not None:
+            # Callers mutate the returned context, so never hand out the cached one
+            return copy.deepcopy(cached)
+
+        ctx = self._parse_context(_decode_text(data))
+        if len(_PARSE_CACHE) >= _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+        _PARSE_CACHE[key] = copy.deepcopy(ctx)
+        return ctx
 
-    def save(self, context: ProjectContext | None = None) -> None:
-        """Save context to file."""
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer saving until the block exits, writing the file once.
+
+        Nested batches write when the outermost one exits. The write also
+        happens when the block raises, so changes made before the error are
+        kept, as they would have been without batching.
+
+        Usage::
+
+            with manager.batch():
+                manager.add_convention("naming", "snake_case")
+                manager.add_note("...")
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.save()
+
+    def save(self, context: ProjectContext | None = None, _now: datetime | None = None) -> None:
+        """Save context to file.
+
+        ``_now`` lets mutators reuse the timestamp they already took for the event.
+        """
+        if self._batch_depth:
+            # Written when the outermost batch exits
+            if context is not None:
+                self._context = context
+            return
         ctx = context or self._context or ProjectContext()
 
         # Ensure directory exists
         self.context_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Update metadata
-        ctx.last_updated = datetime.now()
+        ctx.last_updated = _now or datetime.now()
         if not ctx.last_updated_by:
             ctx.last_updated_by = self._get_current_user()
 
         content = self._generate_markdown(ctx)
-        self.context_path.write_text(content)
+        self._write_context(content.encode("utf-8"))
         self._context = ctx
 
     def add_change(
@@ -75,8 +253,9 @@ class ContextManager:
         files_changed: list[str] | None = None,
     ) -> ChangeEntry:
         """Add a change entry to the context."""
+        now = datetime.now()
         entry = ChangeEntry(
-            date=datetime.now(),
+            date=now,
             author=self._get_current_user(),
             change_type=change_type,
             summary=summary,
@@ -85,18 +264,71 @@ class ContextManager:
             files_changed=files_changed or [],
         )
 
-        self.context.add_change(entry)
-        self.save()
+        self.context.add_change(entry, now=now)
+        if self._batch_depth or not self._fast_append_change(entry):
+            self.save(_now=now)
 
         # Also append to changelog file
         self._append_to_changelog(entry)
 
         return entry
 
+    def _fast_append_change(self, entry: ChangeEntry) -> bool:
+        """Splice a new newest change into the existing file without a full save.
+
+        Only applies while every change still fits in the rendered "Recent
+        Changes" window and ``entry`` sorts first; returns False when the
+        caller must fall back to ``save()``.
+        """
+        ctx = self.context
+        if len(ctx.changelog) > _RECENT_CHANGES_LIMIT:
+            return False
+        if any(other.date > entry.date for other in ctx.changelog):
+            return False
+
+        try:
+            raw = _decode_text(self.context_path.read_bytes())
+        except OSError:
+            return False
+
+        idx = raw.find(_RECENT_CHANGES_MARKER)
+        if idx < 0 or not _LAST_UPDATED_RE.search(raw):
+            return False
+        insert_at = idx + len(_RECENT_CHANGES_MARKER)
+
+        block = f"{entry.to_markdown()}\n\n"
+        if raw.startswith(_NO_CHANGES_PLACEHOLDER, insert_at):
+            tail = raw[insert_at + len(_NO_CHANGES_PLACEHOLDER) :]
+        else:
+            tail = raw[insert_at:]
+        head = raw[:insert_at]
+
+        # Refresh the metadata lines in the header
+        ctx.last_updated = entry.date
+        if not ctx.last_updated_by:
+            ctx.last_updated_by = self._get_current_user()
+        updated = ctx.last_updated.strftime("%Y-%m-%d %H:%M")
+        updated_by = f"*Updated by: @{ctx.last_updated_by}*"
+        head = _LAST_UPDATED_RE.sub(lambda _: f"*Last updated: {updated}*", head, count=1)
+        if _UPDATED_BY_RE.search(head):
+            head = _UPDATED_BY_RE.sub(lambda _: updated_by, head, count=1)
+        else:
+            head = _LAST_UPDATED_RE.sub(lambda m: f"{m.group(0)}\n{updated_by}", head, count=1)
+
+        self._write_context((head + block + tail).encode("utf-8"))
+        return True
+
+    def _write_context(self, data: bytes) -> None:
+        """Write the context file and record its new stat for load()."""
+        self.context_path.write_bytes(data)
+        st = self.context_path.stat()
+        _STAT_CACHE[self.context_path] = (st.st_mtime_ns, st.st_size, _digest(data))
+
     def add_note(self, note: str) -> None:
         """Add a note to the context."""
-        self.context.add_note(note, self._get_current_user())
-        self.save()
+        now = datetime.now()
+        self.context.add_note(note, self._get_current_user(), now=now)
+        self.save(_now=now)
 
     def update_overview(self, overview: str) -> None:
         """Update the project overview."""
@@ -133,23 +365,7 @@ class ContextManager:
 
     def _get_current_user(self) -> str:
         """Get current user name from git or environment."""
-        # Try git config first
-        try:
-            import subprocess
-
-            result = subprocess.run(
-                ["git", "config", "user.name"],
-                capture_output=True,
-                text=True,
-                cwd=self.project_dir,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip()
-        except Exception:
-            pass
-
-        # Fall back to environment
-        return os.environ.get("USER", os.environ.get("USERNAME", "unknown"))
+        return _resolve_user(str(self.project_dir))
 
     def _parse_context(self, content: str) -> ProjectContext:
         """Parse markdown content into ProjectContext."""
@@ -162,7 +378,7 @@ class ContextManager:
         if "Project Context" in sections:
             # Extract project name from header
             header = sections.get("Project Context", "")
-            if match := re.search(r"#\s+(.+?)(?:\n|$)", header):
+            if match := _HEADER_RE.search(header):
                 ctx.name = match.group(1).replace("Project Context", "").strip(" -:")
 
         if "Overview" in sections:
@@ -190,26 +406,22 @@ class ContextManager:
 
     def _split_sections(self, content: str) -> dict[str, str]:
         """Split markdown into sections by headers."""
+        # [preamble, header, body, header, body, ...]
+        parts = _SECTION_SPLIT_RE.split(content)
         sections: dict[str, str] = {}
-        current_section = ""
-        current_content: list[str] = []
-
-        for line in content.split("\n"):
-            if line.startswith("## "):
-                if current_section:
-                    sections[current_section] = "\n".join(current_content)
-                current_section = line[3:].strip()
-                current_content = []
-            elif line.startswith("# "):
-                if current_section:
-                    sections[current_section] = "\n".join(current_content)
-                current_section = line[2:].strip()
-                current_content = []
-            else:
-                current_content.append(line)
-
-        if current_section:
-            sections[current_section] = "\n".join(current_content)
+        last = len(parts) - 1
+
+        for i in range(1, len(parts), 2):
+            name = parts[i].strip()
+            body = parts[i + 1]
+            # Drop the newline ending the header line and, unless this is the
+            # last section, the one that precedes the next header
+            if body.startswith("\n"):
+                body = body[1:]
+            if i + 1 < last and body.endswith("\n"):
+                body = body[:-1]
+            if name:
+                sections[name] = body
 
         return sections
 
@@ -217,30 +429,22 @@ class ContextManager:
         """Parse tech stack section."""
         stack = TechStack()
 
-        for line in content.split("\n"):
+        for line in io.StringIO(content):
             line = line.strip()
-            if line.startswith("**Languages:**"):
-                stack.languages = self._parse_list_inline(line)
-            elif line.startswith("**Frameworks:**"):
-                stack.frameworks = self._parse_list_inline(line)
-            elif line.startswith("**Databases:**"):
-                stack.databases = self._parse_list_inline(line)
-            elif line.startswith("**Tools:**"):
-                stack.tools = self._parse_list_inline(line)
+            if line.startswith("**"):
+                # One lookup on the "**Label:**" prefix instead of a startswith chain
+                end = line.find(":**")
+                if end > 0 and (attr := _TECH_STACK_LABELS.get(line[: end + 3])):
+                    setattr(stack, attr, self._parse_list_inline(line))
             elif line.startswith("- "):
                 # Handle bullet point format
                 item = line[2:].strip()
                 # Try to categorize
-                if any(
-                    x in item.lower()
-                    for x in ["python", "javascript", "typescript", "java", "go", "rust"]
-                ):
+                if _LANG_KEYWORD_RE.search(item):
                     stack.languages.append(item)
-                elif any(
-                    x in item.lower() for x in ["react", "vue", "fastapi", "django", "spring"]
-                ):
+                elif _FRAMEWORK_KEYWORD_RE.search(item):
                     stack.frameworks.append(item)
-                elif any(x in item.lower() for x in ["postgres", "mysql", "mongodb", "redis"]):
+                elif _DB_KEYWORD_RE.search(item):
                     stack.databases.append(item)
                 else:
                     stack.tools.append(item)
@@ -253,7 +457,7 @@ class ContextManager:
         if ":" in line:
             line = line.split(":", 1)[1]
         # Remove markdown formatting
-        line = re.sub(r"\*\*|\*|`", "", line)
+        line = _MD_FMT_RE.sub("", line)
         # Split and clean
         return [x.strip() for x in line.split(",") if x.strip()]
 
@@ -261,15 +465,15 @@ class ContextManager:
         """Parse conventions section."""
         conventions = []
 
-        for line in content.split("\n"):
+        for line in io.StringIO(content):
             line = line.strip()
             if line.startswith("- "):
                 line = line[2:]
                 # Try to extract category
-                if match := re.match(r"\*\*(.+?):\*\*\s*(.+)", line):
+                if match := _CONVENTION_RE.match(line):
                     conventions.append(
                         Convention(
-                            category=match.group(1),
+                            category=sys.intern(match.group(1)),
                             rule=match.group(2),
                         )
                     )
@@ -288,11 +492,13 @@ class ContextManager:
         entries = []
         current_entry: dict[str, Any] | None = None
 
-        for line in content.split("\n"):
+        for line in io.StringIO(content):
             line = line.strip()
+            # Only headers and bullets carry data; gate on the first character
+            lead = line[:1]
 
             # Match header: ### 2024-01-15 - Summary [type] (@author)
-            if line.startswith("### "):
+            if lead == "#" and line.startswith("### "):
                 if current_entry:
                     entries.append(self._create_entry(current_entry))
 
@@ -300,23 +506,15 @@ class ContextManager:
 
                 # Parse header
                 header = line[4:]
-                if match := re.match(
-                    r"(\d{4}-\d{2}-\d{2})\s*(?:\d{2}:\d{2})?\s*-\s*(.+?)(?:\s*\[(\w+)\])?\s*(?:\(@(\w+)\))?$",
-                    header,
-                ):
-                    current_entry["date"] = match.group(1)
-                    current_entry["summary"] = match.group(2).strip()
-                    current_entry["type"] = match.group(3) or "feature"
-                    current_entry["author"] = match.group(4) or "unknown"
-
-            elif current_entry:
-                if line.startswith("- "):
-                    current_entry["details"].append(line[2:])
-                elif line.startswith("**Decisions:**"):
-                    pass  # Next lines will be decisions
-                elif "decision" in line.lower() or (current_entry.get("in_decisions")):
-                    if line.startswith("- "):
-                        current_entry["decisions"].append(line[2:])
+                if parsed := _parse_changelog_header(header):
+                    date, summary, type_str, author = parsed
+                    current_entry["date"] = date
+                    current_entry["summary"] = summary.strip()
+                    current_entry["type"] = type_str or "feature"
+                    current_entry["author"] = author or "unknown"
+
+            elif lead == "-" and current_entry and line.startswith("- "):
+                current_entry["details"].append(line[2:])
 
         if current_entry:
             entries.append(self._create_entry(current_entry))
@@ -326,19 +524,17 @@ class ContextManager:
     def _create_entry(self, data: dict[str, Any]) -> ChangeEntry:
         """Create a ChangeEntry from parsed data."""
         try:
-            date = datetime.strptime(data.get("date", ""), "%Y-%m-%d")
+            date = _parse_ymd(data.get("date", ""))
         except ValueError:
             date = datetime.now()
 
         type_str = data.get("type", "feature").lower()
-        try:
-            change_type = ChangeType(type_str)
-        except ValueError:
-            change_type = ChangeType.FEATURE
+        change_type = _CHANGE_TYPES.get(type_str, ChangeType.FEATURE)
 
         return ChangeEntry(
             date=date,
-            author=data.get("author", "unknown"),
+            # The same few authors recur across entries, so share one string each
+            author=sys.intern(data.get("author", "unknown")),
             change_type=change_type,
             summary=data.get("summary", ""),
             details=data.get("details", []),
@@ -350,14 +546,14 @@ class ContextManager:
         """Parse known issues section."""
         issues = []
 
-        for line in content.split("\n"):
+        for line in io.StringIO(content):
             line = line.strip()
             if line.startswith("- "):
                 line = line[2:]
                 # Try to extract severity
                 severity = "info"
-                if match := re.match(r"\[(\w+)\]\s*(.+)", line):
-                    severity = match.group(1).lower()
+                if match := _ISSUE_SEVERITY_RE.match(line):
+                    severity = sys.intern(match.group(1).lower())
                     line = match.group(2)
 
                 issues.append(
@@ -373,112 +569,100 @@ class ContextManager:
         """Parse notes section."""
         notes = []
 
-        for line in content.split("\n"):
+        for line in io.StringIO(content):
             line = line.strip()
-            if line.startswith("- "):
-                notes.append(line[2:])
-            elif line and not line.startswith("#"):
-                notes.append(line)
+            lead = line[:1]
+            if not lead or lead == "#":
+                continue
+            notes.append(line[2:] if lead == "-" and line[1:2] == " " else line)
 
         return [n for n in notes if n]
 
     def _generate_markdown(self, ctx: ProjectContext) -> str:
         """Generate markdown from ProjectContext."""
-        lines = []
+        buf = io.StringIO()
+        w = buf.write
 
         # Header
         name = ctx.name or self.project_dir.name
-        lines.append(f"# Project Context - {name}")
-        lines.append("")
-        lines.append(
-            f"*Last updated: {ctx.last_updated.strftime('%Y-%m-%d %H:%M') if ctx.last_updated else 'never'}*"
-        )
+        updated = ctx.last_updated.strftime("%Y-%m-%d %H:%M") if ctx.last_updated else "never"
+        w(f"# Project Context - {name}\n\n*Last updated: {updated}*\n")
         if ctx.last_updated_by:
-            lines.append(f"*Updated by: @{ctx.last_updated_by}*")
-        lines.append("")
+            w(f"*Updated by: @{ctx.last_updated_by}*\n")
+        w("\n")
 
         # Overview
-        lines.append("## Overview")
-        lines.append("")
-        lines.append(
-            ctx.overview or "*No overview yet. Run `/context refresh` to analyze the project.*"
-        )
-        lines.append("")
+        w("## Overview\n\n")
+        w(ctx.overview or "*No overview yet. Run `/context refresh` to analyze the project.*")
+        w("\n\n")
 
         # Architecture
-        lines.append("## Architecture")
-        lines.append("")
-        lines.append(ctx.architecture or "*No architecture description yet.*")
-        lines.append("")
+        w("## Architecture\n\n")
+        w(ctx.architecture or "*No architecture description yet.*")
+        w("\n\n")
 
         # Tech Stack
-        lines.append("## Tech Stack")
-        lines.append("")
+        w("## Tech Stack\n\n")
         if ctx.tech_stack.languages or ctx.tech_stack.frameworks:
-            lines.append(ctx.tech_stack.to_markdown())
+            w(ctx.tech_stack.to_markdown())
         else:
-            lines.append("*Tech stack will be detected on first analysis.*")
-        lines.append("")
+            w("*Tech stack will be detected on first analysis.*")
+        w("\n\n")
 
         # Conventions
-        lines.append("## Conventions")
-        lines.append("")
+        w("## Conventions\n\n")
         if ctx.conventions:
-            for conv in ctx.conventions:
-                lines.append(f"- **{conv.category}:** {conv.rule}")
+            w("".join(f"- **{conv.category}:** {conv.rule}\n" for conv in ctx.conventions))
         else:
-            lines.append("*No conventions documented yet.*")
-        lines.append("")
+            w("*No conventions documented yet.*\n")
+        w("\n")
 
         # Recent Changes
-        lines.append("## Recent Changes")
-        lines.append("")
-        recent = ctx.get_recent_changes(10)
+        w("## Recent Changes\n\n")
+        recent = ctx.get_recent_changes(_RECENT_CHANGES_LIMIT)
         if recent:
-            for entry in recent:
-                lines.append(entry.to_markdown())
-                lines.append("")
+            w("".join(f"{entry.to_markdown()}\n\n" for entry in recent))
         else:
-            lines.append("*No changes recorded yet.*")
-        lines.append("")
+            w("*No changes recorded yet.*\n")
+        w("\n")
 
         # Known Issues
-        lines.append("## Known Issues")
-        lines.append("")
+        w("## Known Issues\n\n")
         if ctx.known_issues:
-            for issue in ctx.known_issues:
-                lines.append(f"- [{issue.severity}] {issue.description}")
+            w("".join(f"- [{issue.severity}] {issue.description}\n" for issue in ctx.known_issues))
         else:
-            lines.append("*No known issues.*")
-        lines.append("")
+            w("*No known issues.*\n")
+        w("\n")
 
         # Notes
-        lines.append("## Notes")
-        lines.append("")
+        w("## Notes\n\n")
         if ctx.notes:
-            for note in ctx.notes:
-                lines.append(f"- {note}")
+            w("".join(f"- {note}\n" for note in ctx.notes))
         else:
-            lines.append("*Add notes with `/context note <your note>`*")
-        lines.append("")
+            w("*Add notes with `/context note <your note>`*\n")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _append_to_changelog(self, entry: ChangeEntry) -> None:
         """Append entry to separate changelog file."""
         self.changelog_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create or append
-        if not self.changelog_path.exists():
-            header = f"# Changelog - {self.project_dir.name}\n\n"
-            header += "*AI-assisted changes tracked by kira*\n\n"
-            header += "---\n\n"
-            self.changelog_path.write_text(header)
-
-        # Append new entry
-        with open(self.changelog_path, "a") as f:
-            f.write(entry.to_markdown())
-            f.write("\n\n---\n\n")
+        # Create with a header only if the file does not exist yet
+        try:
+            with open(self.changelog_path, "xb") as f:
+                header = (
+                    f"# Changelog - {self.project_dir.name}\n\n"
+                    "*AI-assisted changes tracked by kira*\n\n"
+                    "---\n\n"
+                )
+                f.write(header.encode("utf-8"))
+        except FileExistsError:
+            pass
+
+        # Append new entry in a single write
+        payload = f"{entry.to_markdown()}\n\n---\n\n".encode()
+        with open(self.changelog_path, "ab") as f:
+            f.write(payload)
 
 
 def get_context_manager(project_dir: Path | None = None) -> ContextManager:
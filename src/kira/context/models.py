@@ -2,12 +2,29 @@
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
-
-
-class ChangeType(Enum):
+from enum import StrEnum
+from itertools import pairwise
+from operator import attrgetter
+
+# Fixed markdown scaffolding, formatted with only the dynamic fields per call
+_ENTRY_HEADER = "### {date} - {summary} [{type}] (@{author})".format
+_ENTRY_FILES = "*Files: {}*".format
+_ENTRY_MORE_FILES = "*... and {} more*".format
+_STACK_LINES = (
+    ("languages", "**Languages:** "),
+    ("frameworks", "**Frameworks:** "),
+    ("databases", "**Databases:** "),
+    ("tools", "**Tools:** "),
+)
+_RECENT_CHANGE = "- [{date}] {summary} (@{author})".format
+
+_date_key = attrgetter("date")
+
+
+class ChangeType(StrEnum):
     """Type of change made to the project."""
 
     FEATURE = "feature"
@@ -19,7 +36,7 @@ class ChangeType(Enum):
     ARCHITECTURE = "architecture"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChangeEntry:
     """A single change entry in the changelog."""
 
@@ -33,30 +50,29 @@ class ChangeEntry:
 
     def to_markdown(self) -> str:
         """Convert to markdown format."""
-        lines = []
-        date_str = self.date.strftime("%Y-%m-%d %H:%M")
-        type_badge = f"[{self.change_type.value}]"
-        lines.append(f"### {date_str} - {self.summary} {type_badge} (@{self.author})")
-
-        for detail in self.details:
-            lines.append(f"- {detail}")
+        lines = [
+            _ENTRY_HEADER(
+                date=self.date.strftime("%Y-%m-%d %H:%M"),
+                summary=self.summary,
+                type=self.change_type.value,
+                author=self.author,
+            )
+        ]
+        lines.extend(f"- {detail}" for detail in self.details)
 
         if self.decisions:
-            lines.append("")
-            lines.append("**Decisions:**")
-            for decision in self.decisions:
-                lines.append(f"- {decision}")
+            lines.extend(("", "**Decisions:**"))
+            lines.extend(f"- {decision}" for decision in self.decisions)
 
         if self.files_changed:
-            lines.append("")
-            lines.append(f"*Files: {', '.join(self.files_changed[:5])}*")
+            lines.extend(("", _ENTRY_FILES(", ".join(self.files_changed[:5]))))
             if len(self.files_changed) > 5:
-                lines.append(f"*... and {len(self.files_changed) - 5} more*")
+                lines.append(_ENTRY_MORE_FILES(len(self.files_changed) - 5))
 
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class TechStack:
     """Technology stack information."""
 
@@ -67,19 +83,14 @@ class TechStack:
 
     def to_markdown(self) -> str:
         """Convert to markdown format."""
-        lines = []
-        if self.languages:
-            lines.append(f"**Languages:** {', '.join(self.languages)}")
-        if self.frameworks:
-            lines.append(f"**Frameworks:** {', '.join(self.frameworks)}")
-        if self.databases:
-            lines.append(f"**Databases:** {', '.join(self.databases)}")
-        if self.tools:
-            lines.append(f"**Tools:** {', '.join(self.tools)}")
-        return "\n".join(lines)
+        return "\n".join(
+            label + ", ".join(items)
+            for attr, label in _STACK_LINES
+            if (items := getattr(self, attr))
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Convention:
     """A coding convention or pattern."""
 
@@ -88,7 +99,7 @@ class Convention:
     example: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class KnownIssue:
     """A known issue or limitation."""
 
@@ -98,7 +109,7 @@ class KnownIssue:
     added_by: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class ProjectContext:
     """Complete project context for sharing between engineers."""
 
@@ -131,71 +142,70 @@ class ProjectContext:
 
     def get_recent_changes(self, limit: int = 5) -> list[ChangeEntry]:
         """Get most recent changes."""
-        sorted_changes = sorted(
-            self.changelog,
-            key=lambda x: x.date,
-            reverse=True,
-        )
-        return sorted_changes[:limit]
+        changelog = self.changelog
+        # Entries appended via add_change are usually already in date order
+        if all(a.date < b.date for a, b in pairwise(changelog)):
+            return changelog[: -limit - 1 : -1] if limit > 0 else []
+        return heapq.nlargest(limit, changelog, key=_date_key)
 
-    def add_change(self, entry: ChangeEntry) -> None:
+    def add_change(self, entry: ChangeEntry, now: datetime | None = None) -> None:
         """Add a change entry."""
         self.changelog.append(entry)
-        self.last_updated = datetime.now()
+        self.last_updated = now or datetime.now()
         self.last_updated_by = entry.author
 
-    def add_note(self, note: str, author: str | None = None) -> None:
+    def add_note(self, note: str, author: str | None = None, now: datetime | None = None) -> None:
         """Add a note."""
-        timestamp = datetime.now().strftime("%Y-%m-%d")
+        now = now or datetime.now()
+        timestamp = now.strftime("%Y-%m-%d")
         if author:
             self.notes.append(f"[{timestamp}] (@{author}) {note}")
         else:
             self.notes.append(f"[{timestamp}] {note}")
-        self.last_updated = datetime.now()
+        self.last_updated = now
 
     def to_prompt_context(self) -> str:
         """Convert to a concise context string for prompts."""
-        lines = []
+        lines: list[str] = []
+        # Push whole sections at once rather than one append per line
+        extend = lines.extend
 
         if self.name:
-            lines.append(f"# Project: {self.name}")
-            lines.append("")
+            extend((f"# Project: {self.name}", ""))
 
         if self.overview:
-            lines.append("## Overview")
-            lines.append(self.overview)
-            lines.append("")
+            extend(("## Overview", self.overview, ""))
 
         if self.architecture:
-            lines.append("## Architecture")
-            lines.append(self.architecture)
-            lines.append("")
+            extend(("## Architecture", self.architecture, ""))
 
         if self.tech_stack.languages or self.tech_stack.frameworks:
-            lines.append("## Tech Stack")
-            lines.append(self.tech_stack.to_markdown())
-            lines.append("")
+            extend(("## Tech Stack", self.tech_stack.to_markdown(), ""))
 
         if self.conventions:
             lines.append("## Conventions")
-            for conv in self.conventions[:10]:  # Limit to avoid too much context
-                lines.append(f"- **{conv.category}:** {conv.rule}")
+            # Limit to avoid too much context
+            extend(f"- **{conv.category}:** {conv.rule}" for conv in self.conventions[:10])
             lines.append("")
 
         # Recent changes (last 3)
         recent = self.get_recent_changes(3)
         if recent:
             lines.append("## Recent Changes")
-            for change in recent:
-                date_str = change.date.strftime("%Y-%m-%d")
-                lines.append(f"- [{date_str}] {change.summary} (@{change.author})")
+            extend(
+                _RECENT_CHANGE(
+                    date=change.date.strftime("%Y-%m-%d"),
+                    summary=change.summary,
+                    author=change.author,
+                )
+                for change in recent
+            )
             lines.append("")
 
         # Known issues
         if self.known_issues:
             lines.append("## Known Issues")
-            for issue in self.known_issues[:5]:
-                lines.append(f"- [{issue.severity}] {issue.description}")
+            extend(f"- [{issue.severity}] {issue.description}" for issue in self.known_issues[:5])
             lines.append("")
 
         return "\n".join(lines)
@@ -2,13 +2,84 @@
 
 from __future__ import annotations
 
+import fnmatch
+import functools
+import mmap
+import os
 import re
 import subprocess
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
 
 
-@dataclass
+def _iter_lines(f: Iterable[str]) -> Iterator[str]:
+    """Yield the lines of a text file exactly as ``read().split("\\n")`` would."""
+    line = "\n"  # An empty file still splits into one empty line
+    for line in f:
+        yield line[:-1] if line.endswith("\n") else line
+    if line.endswith("\n"):
+        yield ""
+
+
+@functools.lru_cache(maxsize=256)
+def _read_preview(
+    path: str, mtime_ns: int, size: int, highlight: str | None, max_lines: int
+) -> str:
+    """Read only as much of a file as its preview needs.
+
+    The stat fields are part of the cache key so edits are picked up.
+    """
+    if highlight and highlight.isascii() and "\n" not in highlight:
+        with open(path, "rb") as f:
+            data = f.read()
+        # Plain ASCII with "\n" endings reads the same as text; other files
+        # go through the decoder for its case folding and newline handling
+        if data.isascii() and b"\r" not in data:
+            return _ascii_preview(data, highlight.lower().encode(), max_lines)
+
+    with open(path) as f:
+        lines = _iter_lines(f)
+        if not highlight:
+            return "\n".join(islice(lines, max_lines))
+
+        # Find the section containing the highlight, two lines of lead-in
+        needle = highlight.lower()
+        head: list[str] = []
+        before: deque[str] = deque(maxlen=2)
+        for line in lines:
+            if needle in line.lower():
+                window = [*before, line, *islice(lines, max(max_lines - 3, 0))]
+                return "\n".join(window[: max(len(before) + max_lines - 2, 0)])
+            if len(head) < max_lines:
+                head.append(line)
+            before.append(line)
+
+        # Return first N lines
+        return "\n".join(head)
+
+
+def _ascii_preview(data: bytes, needle: bytes, max_lines: int) -> str:
+    """Preview an ASCII file around the first line containing ``needle`` (lowercase)."""
+    idx = data.lower().find(needle)
+    if idx == -1:
+        return b"\n".join(data.split(b"\n", max_lines)[:max_lines]).decode()
+
+    # Back up over at most two lines of lead-in
+    start = data.rfind(b"\n", 0, idx) + 1
+    lead = 0
+    while lead < 2 and start > 0:
+        start = data.rfind(b"\n", 0, start - 1) + 1
+        lead += 1
+    count = lead + 1 + max(max_lines - 3, 0)
+    window = data[start:].split(b"\n", count)[:count]
+    return b"\n".join(window[: max(lead + max_lines - 2, 0)]).decode()
+
+
+@dataclass(slots=True)
 class ContextMatch:
     """A matched file with relevance info."""
 
@@ -18,7 +89,7 @@ class ContextMatch:
     preview: str = ""  # First few lines or matched section
 
 
-@dataclass
+@dataclass(slots=True)
 class SmartContext:
     """Result of smart context detection."""
 
@@ -54,8 +125,31 @@ class SmartContextLoader:
     """Automatically finds relevant files based on task description."""
 
     # Patterns to extract from prompts
+    FILE_EXTENSIONS = (
+        "py",
+        "js",
+        "ts",
+        "jsx",
+        "tsx",
+        "go",
+        "rs",
+        "java",
+        "rb",
+        "php",
+        "vue",
+        "svelte",
+        "css",
+        "scss",
+        "html",
+        "json",
+        "yaml",
+        "yml",
+        "toml",
+        "md",
+    )
+    # Longest extensions first, so "app.tsx" is not cut short to "app.ts"
     FILE_PATTERN = re.compile(
-        r"[\w\-]+\.(?:py|js|ts|jsx|tsx|go|rs|java|rb|php|vue|svelte|css|scss|html|json|yaml|yml|toml|md)"
+        r"[\w\-]+\.(?:" + "|".join(sorted(FILE_EXTENSIONS, key=len, reverse=True)) + ")"
     )
     FUNC_PATTERN = re.compile(r"\b(?:function|def|fn|func)\s+(\w+)|(\w+)\s*\(")
     CLASS_PATTERN = re.compile(r"\b(?:class|struct|interface|type)\s+(\w+)")
@@ -70,10 +164,36 @@ class SmartContextLoader:
         "config": ["config", "settings", "env"],
         "ui": ["component", "view", "page", "template"],
     }
+    # Every KEYWORD_MAP keyword in one zero-width scan. None is a prefix of
+    # another, so each occurrence is reported regardless of overlaps.
+    KEYWORD_PATTERN = re.compile(
+        "(?=(" + "|".join(kw for kws in KEYWORD_MAP.values() for kw in kws) + "))"
+    )
+    KEYWORD_SETS = {category: frozenset(kws) for category, kws in KEYWORD_MAP.items()}
+
+    # Path substrings that mark non-source files (also pruned from rg listings)
+    SKIP_PATTERNS = (
+        "node_modules",
+        ".git",
+        "__pycache__",
+        ".venv",
+        "venv",
+        "dist",
+        "build",
+        ".egg",
+    )
+    SKIP_RE = re.compile("|".join(map(re.escape, SKIP_PATTERNS)))
+    SOURCE_EXTENSIONS = frozenset(
+        (".py", ".js", ".ts", ".jsx", ".tsx", ".go", ".rs", ".java", ".rb", ".vue", ".svelte")
+    )
 
     def __init__(self, project_dir: Path | None = None):
         self.project_dir = project_dir or Path.cwd()
+        # File index: basename -> paths, every entry in walk order, directory ranks
         self._file_cache: dict[str, list[Path]] | None = None
+        self._file_entries: list[Path] = []
+        self._dir_rank: dict[Path, int] = {}
+        self._grep_entries: list[Path] | None = None
 
     def load(self, prompt: str, max_files: int = 5) -> SmartContext:
         """Load relevant context based on prompt.
@@ -86,101 +206,206 @@ class SmartContextLoader:
             SmartContext with matched files
         """
         context = SmartContext()
+        # Candidate [relevance, reason, highlight] per path; only the kept
+        # ones become ContextMatch objects
+        candidates: dict[Path, list] = {}
 
         # Extract keywords and patterns from prompt
-        prompt_lower = prompt.lower()
+        file_refs = self.FILE_PATTERN.findall(prompt)
+        func_matches = self.FUNC_PATTERN.findall(prompt)
+        funcs = [m[0] or m[1] for m in func_matches if m[0] or m[1]]
+        funcs = [f for f in funcs if len(f) >= 3 and f not in ("the", "and", "for", "def", "class")]
+        class_matches = self.CLASS_PATTERN.findall(prompt)
+        import_matches = self.IMPORT_PATTERN.findall(prompt)
+        found = set(self.KEYWORD_PATTERN.findall(prompt.lower()))
+
+        # Nothing to look up: skip the file index and searches entirely
+        if not (file_refs or funcs or class_matches or import_matches or found):
+            return context
+
+        # The index lives for one prompt: every lookup below shares a single
+        # walk, and files changed between prompts are always seen
+        self._file_cache = None
 
         # 1. Direct file references
-        file_refs = self.FILE_PATTERN.findall(prompt)
         for ref in file_refs:
             matches = self._find_files(ref)
             for path in matches[:2]:  # Limit per reference
-                context.matches.append(
-                    ContextMatch(
-                        path=path,
-                        relevance=1.0,
-                        match_reason="directly mentioned",
-                        preview=self._get_preview(path),
-                    )
-                )
+                self._add_match(candidates, path, 1.0, "directly mentioned")
                 context.keywords_found.append(ref)
 
         # 2. Function/class names
-        func_matches = self.FUNC_PATTERN.findall(prompt)
-        funcs = [m[0] or m[1] for m in func_matches if m[0] or m[1]]
+        # One content search for every identifier instead of one per name
+        grep_results = self._grep_many([*funcs, *(f"class {cls}" for cls in class_matches)])
+
         for func in funcs:
-            if len(func) < 3 or func in ("the", "and", "for", "def", "class"):
-                continue
-            matches = self._grep_files(func)
+            matches = grep_results.get(func, [])
             for path in matches[:2]:
-                if not self._already_matched(context, path):
-                    context.matches.append(
-                        ContextMatch(
-                            path=path,
-                            relevance=0.8,
-                            match_reason=f"contains '{func}'",
-                            preview=self._get_preview(path, func),
-                        )
-                    )
+                self._add_match(candidates, path, 0.8, f"contains '{func}'", func)
 
-        class_matches = self.CLASS_PATTERN.findall(prompt)
         for cls in class_matches:
-            matches = self._grep_files(f"class {cls}")
+            matches = grep_results.get(f"class {cls}", [])
             for path in matches[:2]:
-                if not self._already_matched(context, path):
-                    context.matches.append(
-                        ContextMatch(
-                            path=path,
-                            relevance=0.9,
-                            match_reason=f"defines '{cls}'",
-                            preview=self._get_preview(path, cls),
-                        )
-                    )
+                self._add_match(candidates, path, 0.9, f"defines '{cls}'", cls)
 
         # 3. Import paths
-        import_matches = self.IMPORT_PATTERN.findall(prompt)
         for imp in import_matches:
             # Convert import to file path
             imp_path = imp.replace(".", "/") + ".py"
             matches = self._find_files(imp_path)
             for path in matches[:1]:
-                if not self._already_matched(context, path):
-                    context.matches.append(
-                        ContextMatch(
-                            path=path,
-                            relevance=0.85,
-                            match_reason="import reference",
-                            preview=self._get_preview(path),
-                        )
-                    )
+                self._add_match(candidates, path, 0.85, "import reference")
 
         # 4. Keyword-based discovery
-        for category, keywords in self.KEYWORD_MAP.items():
-            if any(kw in prompt_lower for kw in keywords):
-                context.keywords_found.append(category)
-                # Search for files with these keywords
-                for kw in keywords:
-                    if kw in prompt_lower:
-                        matches = self._find_files(f"*{kw}*")
-                        for path in matches[:2]:
-                            if not self._already_matched(context, path):
-                                context.matches.append(
-                                    ContextMatch(
-                                        path=path,
-                                        relevance=0.6,
-                                        match_reason=f"matches '{category}' context",
-                                        preview=self._get_preview(path),
-                                    )
-                                )
-                        break
+        for category, keywords in self.KEYWORD_MAP.items() if found else ():
+            if found.isdisjoint(self.KEYWORD_SETS[category]):
+                continue
+            # First keyword in list order, so the searched pattern stays stable
+            kw = next(kw for kw in keywords if kw in found)
+            context.keywords_found.append(category)
+            # Search for files with the first matching keyword
+            matches = self._find_files(f"*{kw}*")
+            for path in matches[:2]:
+                self._add_match(candidates, path, 0.6, f"matches '{category}' context")
 
         # Limit total matches
-        context.matches = sorted(context.matches, key=lambda m: -m.relevance)[:max_files]
+        ranked = sorted(candidates.items(), key=lambda item: -item[1][0])[:max_files]
+        context.matches = [
+            ContextMatch(path=path, relevance=relevance, match_reason=reason)
+            for path, (relevance, reason, _) in ranked
+        ]
+
+        # Read previews only for the kept matches, overlapping the file reads
+        if len(context.matches) > 1:
+            with ThreadPoolExecutor(max_workers=len(context.matches)) as pool:
+                previews = list(
+                    pool.map(
+                        lambda m: self._get_preview(m.path, candidates[m.path][2]),
+                        context.matches,
+                    )
+                )
+        else:
+            previews = [self._get_preview(m.path, candidates[m.path][2]) for m in context.matches]
+        for match, preview in zip(context.matches, previews, strict=True):
+            match.preview = preview
 
         return context
 
+    def _build_index(self) -> dict[str, list[Path]]:
+        """Index the project's files once, preferring ``rg --files``.
+
+        ripgrep walks in parallel and prunes ignored and skipped trees; its
+        listing is sorted by path. Without ripgrep the tree is walked with
+        scandir in ``rglob`` order.
+        """
+        entries = self._list_files_rg()
+        dir_rank: dict[Path, int] = {}
+        if entries is None:
+            entries, dir_rank = self._walk_files()
+
+        by_name: dict[str, list[Path]] = {}
+        for path in entries:
+            by_name.setdefault(path.name, []).append(path)
+
+        self._file_entries = entries
+        self._dir_rank = dir_rank
+        self._grep_entries = None
+        self._file_cache = by_name
+        return by_name
+
+    def _list_files_rg(self) -> list[Path] | None:
+        """List project files with ripgrep, or None if it is unavailable."""
+        globs = [arg for skip in self.SKIP_PATTERNS for arg in ("-g", f"!*{skip}*")]
+        try:
+            result = subprocess.run(
+                ["rg", "--files", *globs],
+                cwd=self.project_dir,
+                capture_output=True,
+                text=True,
+                timeout=3,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        if result.returncode != 0:
+            return None
+        return [self.project_dir / line for line in sorted(result.stdout.splitlines())]
+
+    def _walk_files(self) -> tuple[list[Path], dict[Path, int]]:
+        """Walk the project with scandir, in the same order as ``rglob``.
+
+        Directories are visited depth-first in listing order without following
+        symlinks. Returns every entry plus each directory's visit rank.
+        """
+        entries: list[Path] = []
+        dir_rank: dict[Path, int] = {}
+        stack = [self.project_dir]
+        while stack:
+            directory = stack.pop()
+            dir_rank[directory] = len(dir_rank)
+            subdirs = []
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        path = directory / entry.name
+                        entries.append(path)
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(path)
+                        except OSError:
+                            pass
+            except OSError:
+                continue
+            stack.extend(reversed(subdirs))
+        return entries, dir_rank
+
+    def _get_index(self) -> dict[str, list[Path]]:
+        """Return the file index for the current load, building it on first use."""
+        if self._file_cache is None:
+            return self._build_index()
+        return self._file_cache
+
     def _find_files(self, pattern: str) -> list[Path]:
-        """Find files matching pattern using glob."""
+        """Find files matching pattern using the cached file index."""
+        parts = pattern.split("/")
+        if (
+            all(parts)
+            and "**" not in pattern
+            and not any(c in pattern for c in "?[")
+            and ("*" not in pattern or len(parts) == 1)
+        ):
+            index = self._get_index()
+            if "*" in pattern:
+                inner = pattern[1:-1]
+                if pattern[:1] == pattern[-1:] == "*" and "*" not in inner:
+                    # "*kw*": a plain substring test per name
+                    matches = [p for p in self._file_entries if inner in p.name]
+                else:
+                    # Rare other shapes; fnmatch keeps its own compiled-pattern cache
+                    matches = [
+                        p for p in self._file_entries if fnmatch.fnmatchcase(p.name, pattern)
+                    ]
+                return [p for p in matches if self._is_valid_file(p)][:10]
+
+            candidates = index.get(parts[-1], [])
+            if len(parts) > 1:
+                # Suffix match on the directory parts, ordered like a glob from each ancestor
+                depth = len(parts) - 1
+                rank = self._dir_rank
+                min_parts = len(self.project_dir.parts) + len(parts)
+                candidates = sorted(
+                    (
+                        p
+                        for p in candidates
+                        if len(p.parts) >= min_parts and list(p.parts[-len(parts) :]) == parts
+                    ),
+                    key=lambda p: rank.get(p.parents[depth], 0),
+                )
+            return [p for p in candidates if self._is_valid_file(p)]
+
+        return self._glob_files(pattern)
+
+    def _glob_files(self, pattern: str) -> list[Path]:
+        """Find files matching an arbitrary glob pattern with ``rglob``."""
         try:
             # Try exact match first
             if "*" not in pattern:
@@ -196,21 +421,66 @@ class SmartContextLoader:
 
     def _grep_files(self, pattern: str) -> list[Path]:
         """Search file contents for pattern using grep/rg."""
+        return self._grep_many([pattern]).get(pattern, [])
+
+    def _grep_many(self, patterns: list[str]) -> dict[str, list[Path]]:
+        """Search file contents for several literal patterns in a single pass.
+
+        The search lists every file matching any pattern; with more than one
+        pattern, each file is then checked for the individual patterns so the
+        result per pattern matches a separate search.
+        """
+        patterns = list(dict.fromkeys(patterns))
+        if not patterns:
+            return {}
+
+        candidates = self._search_candidates(patterns)
+        if len(patterns) == 1:
+            valid = (p for p in candidates if self._is_valid_file(p))
+            return {patterns[0]: list(islice(valid, 10))}
+
+        results: dict[str, list[Path]] = {pattern: [] for pattern in patterns}
+        needles = {pattern: pattern.encode() for pattern in patterns}
+        for path in candidates:
+            if not needles:
+                break
+            if not self._is_valid_file(path):
+                continue
+            try:
+                data = path.read_bytes()
+            except OSError:
+                continue
+            for pattern, needle in list(needles.items()):
+                if needle in data:
+                    results[pattern].append(path)
+                    if len(results[pattern]) == 10:
+                        del needles[pattern]
+        return results
+
+    def _search_candidates(self, patterns: list[str]) -> Iterable[Path]:
+        """List files containing any of ``patterns``, in search order."""
+        pattern_args = [arg for pattern in patterns for arg in ("-e", pattern)]
         try:
             # Try ripgrep first (faster)
             result = subprocess.run(
                 [
                     "rg",
                     "-l",
-                    "--type-not",
-                    "binary",
+                    # Bound the work: skip huge/generated files, don't oversubscribe
+                    "--max-filesize=1M",
+                    "--max-columns=200",
+                    "--threads=2",
                     "-g",
                     "!node_modules",
                     "-g",
                     "!.git",
                     "-g",
                     "!*.lock",
-                    pattern,
+                    "-g",
+                    "!*.min.*",
+                    "-g",
+                    "!*.map",
+                    *pattern_args,
                 ],
                 cwd=self.project_dir,
                 capture_output=True,
@@ -218,92 +488,112 @@ class SmartContextLoader:
                 timeout=5,
             )
             if result.returncode == 0:
-                paths = [self.project_dir / p for p in result.stdout.strip().split("\n") if p]
-                return [p for p in paths if self._is_valid_file(p)][:10]
+                return [self.project_dir / p for p in result.stdout.strip().split("\n") if p]
+            if result.returncode == 1:
+                # ripgrep ran and found nothing; searching again would too
+                return []
         except FileNotFoundError:
             pass
         except Exception:
             pass
 
-        # Fallback to grep
-        try:
-            result = subprocess.run(
-                ["grep", "-rl", "--include=*.py", "--include=*.js", "--include=*.ts", pattern, "."],
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                paths = [
-                    self.project_dir / p.lstrip("./")
-                    for p in result.stdout.strip().split("\n")
-                    if p
-                ]
-                return [p for p in paths if self._is_valid_file(p)][:10]
-        except Exception:
-            pass
+        # Fallback (no ripgrep, search error or timeout): scan the indexed
+        # source files in-process
+        return self._scan_files(patterns)
+
+    def _scan_files(self, patterns: list[str]) -> Iterator[Path]:
+        """Yield .py/.js/.ts files containing any of ``patterns``, lazily.
 
-        return []
+        Walks the cached file index in ``grep -r`` order (depth-first,
+        symlinks skipped) and searches each file through mmap.
+        """
+        needles = [pattern.encode() for pattern in patterns]
+        for path in self._grep_order():
+            if not path.name.endswith((".py", ".js", ".ts")):
+                continue
+            try:
+                if path.is_symlink():
+                    continue
+                with (
+                    open(path, "rb") as f,
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+                ):
+                    if any(mm.find(needle) != -1 for needle in needles):
+                        yield path
+            except (OSError, ValueError):
+                # Unreadable, a directory, or empty (which mmap refuses)
+                continue
+
+    def _grep_order(self) -> list[Path]:
+        """Index entries in depth-first order, descending into each directory in place."""
+        self._get_index()
+        if self._grep_entries is not None:
+            return self._grep_entries
+        if not self._dir_rank:
+            # rg listings are already sorted by path
+            self._grep_entries = self._file_entries
+            return self._grep_entries
+
+        children: dict[Path, list[Path]] = {}
+        for path in self._file_entries:
+            children.setdefault(path.parent, []).append(path)
+        order: list[Path] = []
+        stack = [iter(children.get(self.project_dir, ()))]
+        while stack:
+            for path in stack[-1]:
+                order.append(path)
+                if path in self._dir_rank:
+                    stack.append(iter(children.get(path, ())))
+                    break
+            else:
+                stack.pop()
+        self._grep_entries = order
+        return order
 
     def _is_valid_file(self, path: Path) -> bool:
         """Check if path is a valid source file."""
-        if not path.is_file():
+        path_str = str(path)
+
+        # Check extension straight off the string; a bare ".py" name has no suffix
+        dot = path_str.rfind(".")
+        if path_str[dot:] not in self.SOURCE_EXTENSIONS or path_str[dot - 1] == os.sep:
             return False
 
         # Skip common non-source paths
-        skip_patterns = [
-            "node_modules",
-            ".git",
-            "__pycache__",
-            ".venv",
-            "venv",
-            "dist",
-            "build",
-            ".egg",
-        ]
-        path_str = str(path)
-        if any(skip in path_str for skip in skip_patterns):
+        if self.SKIP_RE.search(path_str):
             return False
 
-        # Check extension
-        valid_extensions = {
-            ".py",
-            ".js",
-            ".ts",
-            ".jsx",
-            ".tsx",
-            ".go",
-            ".rs",
-            ".java",
-            ".rb",
-            ".vue",
-            ".svelte",
-        }
-        return path.suffix in valid_extensions
+        # The stat call last, once the string checks have passed
+        return path.is_file()
 
     def _get_preview(self, path: Path, highlight: str | None = None, max_lines: int = 10) -> str:
         """Get a preview of the file content."""
         try:
-            content = path.read_text()
-            lines = content.split("\n")
-
-            if highlight:
-                # Find the section containing the highlight
-                for i, line in enumerate(lines):
-                    if highlight.lower() in line.lower():
-                        start = max(0, i - 2)
-                        end = min(len(lines), i + max_lines - 2)
-                        return "\n".join(lines[start:end])
-
-            # Return first N lines
-            return "\n".join(lines[:max_lines])
+            st = path.stat()
+            return _read_preview(str(path), st.st_mtime_ns, st.st_size, highlight, max_lines)
         except Exception:
             return ""
 
-    def _already_matched(self, context: SmartContext, path: Path) -> bool:
-        """Check if path is already in matches."""
-        return any(m.path == path for m in context.matches)
+    def _add_match(
+        self,
+        candidates: dict[Path, list],
+        path: Path,
+        relevance: float,
+        reason: str,
+        highlight: str | None = None,
+    ) -> None:
+        """Record a candidate match, merging repeated hits on the same path.
+
+        A merged match keeps the highest relevance and lists every reason;
+        the preview highlight comes from the first hit on the path.
+        """
+        entry = candidates.get(path)
+        if entry is None:
+            candidates[path] = [relevance, reason, highlight]
+            return
+        entry[0] = max(entry[0], relevance)
+        if reason not in entry[1].split("; "):
+            entry[1] += f"; {reason}"
 
 
 def load_smart_context(prompt: str, project_dir: Path | None = None) -> SmartContext:
@@ -8,14 +8,13 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.panel import Panel
-
 from .client import KiraClient
 from .config import Config
 from .verifier import Verifier
 
 if TYPE_CHECKING:
+    from rich.console import Console
+
     from ..correction.loop import SelfCorrector
     from ..correction.models import CorrectionResult
     from ..memory.execution import ExecutionMemory, ExecutionRecord
@@ -84,7 +83,12 @@ class KiraAgent:
             working_dir: Working directory for operations.
         """
         self.config = config or Config.load()
-        self.console = console or Console()
+        if console is None:
+            # rich is only needed once output is produced; import it on demand
+            from rich.console import Console
+
+            console = Console()
+        self.console = console
         self.working_dir = working_dir or Path.cwd()
 
         # Initialize client
@@ -181,10 +185,13 @@ class KiraAgent:
 
         self._log_header(f"Task: {task[:100]}...")
 
+        # Resolve the lazy component once for the whole run
+        memory = self.memory if use_learn else None
+
         # Step 1: Check execution memory for similar tasks
         history: list[ExecutionRecord] = []
-        if use_learn:
-            history = self.memory.get_relevant_history(task, limit=3)
+        if memory is not None:
+            history = memory.get_relevant_history(task, limit=3)
             if history:
                 self._log_info(f"Found {len(history)} relevant past executions")
                 self._show_history_summary(history)
@@ -202,6 +209,8 @@ class KiraAgent:
             if plan:
                 self._log_success(f"Plan created with {len(plan.final_steps)} steps")
                 if self.config.autonomous.verbose:
+                    from rich.panel import Panel
+
                     self.console.print(Panel(plan.to_context(), title="Execution Plan"))
         else:
             self._log_info("Skipping deep reasoning (disabled)")
@@ -213,16 +222,10 @@ class KiraAgent:
         files_modified: list[str] = []
 
         if plan:
-            # Execute with plan
-            from ..correction.loop import SelfCorrector
-
-            corrector = SelfCorrector(
-                client=self.client,
-                max_retries=retries,
-                use_deep_analysis=self.config.autonomous.deep_analysis,
-                console=self.console,
+            # Execute with plan, reusing the lazily built corrector
+            correction_result = await self.corrector.execute_with_retry(
+                plan, task, max_retries=retries
             )
-            correction_result = await corrector.execute_with_retry(plan, task)
             output = correction_result.final_output
         else:
             # Direct execution without plan
@@ -255,10 +258,10 @@ class KiraAgent:
         success = (correction_result.success if correction_result else True) and verification_passed
         learnings: list[str] = []
 
-        if use_learn:
+        if memory is not None:
             learnings = self._extract_learnings(thinking_result, correction_result)
             if success:
-                self.memory.record_success(
+                memory.record_success(
                     task=task,
                     approach=plan.final_summary if plan else "direct execution",
                     learnings=learnings,
@@ -272,7 +275,7 @@ class KiraAgent:
                     last_analysis = correction_result.analyses[-1]
                     error_type = last_analysis.failure_type.value
                     error_message = last_analysis.root_cause
-                self.memory.record_failure(
+                memory.record_failure(
                     task=task,
                     approach=plan.final_summary if plan else "direct execution",
                     error_type=error_type,
@@ -444,6 +447,8 @@ class KiraAgent:
 
     def _log_header(self, message: str) -> None:
         """Log a header message."""
+        from rich.panel import Panel
+
         self.console.print()
         self.console.print(Panel(message, style="bold cyan"))
 
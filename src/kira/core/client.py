@@ -6,15 +6,19 @@ Uses kiro-cli in non-interactive mode with prompts sent via stdin.
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
 import os
 import re
 import shutil
 import subprocess
+import time
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from datetime import datetime
 
 # ANSI escape code pattern - matches all CSI sequences, OSC sequences, and cursor controls
 ANSI_ESCAPE = re.compile(
@@ -70,8 +74,69 @@ FILTER_PATTERNS = [
     r"^\s*•\s*\d+\s*:",
 ]
 
-# Compiled filter patterns
-COMPILED_FILTERS = [re.compile(p) for p in FILTER_PATTERNS]
+# "^literal" (optionally followed by \s*): plain characters and escaped punctuation only
+_LITERAL_FILTER = re.compile(r"\^((?:[^\\.^$*+?{}\[\]|()]|\\[^\w\s])*)(?:\\s\*)?")
+
+# Filters that are just a fixed line prefix, tested with one startswith() call
+FILTER_PREFIXES = tuple(
+    re.sub(r"\\(.)", r"\1", m.group(1))
+    for p in FILTER_PATTERNS
+    if (m := _LITERAL_FILTER.fullmatch(p))
+)
+
+# The remaining filter patterns as one compiled alternation, matched once per line
+COMPILED_FILTER = re.compile(
+    "|".join(f"(?:{p})" for p in FILTER_PATTERNS if not _LITERAL_FILTER.fullmatch(p))
+)
+
+# Seconds a looked-up kiro-cli version stays valid
+VERSION_TTL = 300.0
+
+# (monotonic time of lookup, version) from the last get_version() call
+_version_cache: tuple[float, str | None] | None = None
+
+
+# Last reminder time per update-check state file, as read or written by this process
+_last_reminded_cache: dict[Path, datetime | None] = {}
+
+
+def _load_last_reminded(state_file: Path) -> datetime | None:
+    """Read when the user was last reminded about updates, once per process."""
+    if state_file in _last_reminded_cache:
+        return _last_reminded_cache[state_file]
+
+    import json
+    from datetime import datetime
+
+    last_reminded = None
+    if state_file.exists():
+        try:
+            state = json.loads(state_file.read_bytes())
+            last_reminded = datetime.fromisoformat(state.get("last_reminded", ""))
+        except (json.JSONDecodeError, ValueError, KeyError):
+            pass
+
+    _last_reminded_cache[state_file] = last_reminded
+    return last_reminded
+
+
+@functools.lru_cache(maxsize=1)
+def _locate_kiro() -> str | None:
+    """Find the kiro-cli executable once per process (see ``KiraClient.refresh``)."""
+    # Check common locations
+    kiro = shutil.which("kiro-cli") or shutil.which("kiro")
+    if kiro:
+        return kiro
+
+    # Check common install paths
+    for path in [
+        os.path.expanduser("~/.local/bin/kiro-cli"),
+        "/usr/local/bin/kiro-cli",
+        os.path.expanduser("~/.npm-global/bin/kiro-cli"),
+    ]:
+        if os.path.exists(path):
+            return path
+    return None
 
 
 @dataclass
@@ -105,39 +170,42 @@ class KiraClient:
         trust_all_tools: bool = False,
         working_dir: Path | None = None,
         timeout: int = 600,
+        extra_env: dict[str, str] | None = None,
     ):
         self.agent = agent
         self.model = model
         self.trust_all_tools = trust_all_tools
         self.working_dir = working_dir or Path.cwd()
         self.timeout = timeout
+        self.extra_env = extra_env
         self._kiro_path: str | None = None
+        # Built commands by (agent, model, trust_all_tools, resume)
+        self._commands: dict[tuple[str | None, str | None, bool, bool], tuple[str, ...]] = {}
 
     def _find_kiro(self) -> str:
         """Find kiro-cli executable."""
         if self._kiro_path:
             return self._kiro_path
 
-        # Check common locations
-        kiro = shutil.which("kiro-cli") or shutil.which("kiro")
+        kiro = _locate_kiro()
         if kiro:
             self._kiro_path = kiro
             return kiro
 
-        # Check common install paths
-        for path in [
-            os.path.expanduser("~/.local/bin/kiro-cli"),
-            "/usr/local/bin/kiro-cli",
-            os.path.expanduser("~/.npm-global/bin/kiro-cli"),
-        ]:
-            if os.path.exists(path):
-                self._kiro_path = path
-                return path
-
         raise KiraNotFoundError(
             "kiro-cli not found. Install from https://kiro.dev or ensure it's in PATH"
         )
 
+    def _subprocess_env(self) -> dict[str, str] | None:
+        """Environment for kiro-cli.
+
+        None lets the child inherit the current environment without copying it;
+        a merged dict is only built when extra variables are set.
+        """
+        if not self.extra_env:
+            return None
+        return {**os.environ, **self.extra_env}
+
     def _build_command(
         self,
         *,
@@ -145,12 +213,18 @@ class KiraClient:
         resume: bool = False,
     ) -> list[str]:
         """Build the kiro-cli command (prompt goes via stdin)."""
+        agent = agent or self.agent
+        # Keyed on the attributes too, since callers switch the model between calls
+        key = (agent, self.model, self.trust_all_tools, resume)
+        if (cached := self._commands.get(key)) is not None:
+            return list(cached)
+
         kiro = self._find_kiro()
         cmd = [kiro, "chat"]
 
         # Agent selection
-        if agent or self.agent:
-            cmd.extend(["--agent", agent or self.agent])
+        if agent:
+            cmd.extend(["--agent", agent])
 
         # Model selection
         if self.model:
@@ -170,41 +244,48 @@ class KiraClient:
         # Disable line wrapping for clean output
         cmd.extend(["--wrap", "never"])
 
+        self._commands[key] = tuple(cmd)
         return cmd
 
     def _clean_line(self, line: str) -> str | None:
         """Clean a single line of output. Returns None if line should be filtered."""
-        # Strip ANSI escape codes
-        line = ANSI_ESCAPE.sub("", line)
+        # Empty lines are always filtered (and are the most common kind)
+        if not line:
+            return None
+
+        # Strip ANSI escape codes (most lines have none)
+        if "\x1b" in line or "\r" in line:
+            line = ANSI_ESCAPE.sub("", line)
 
         # Check if line matches any filter pattern
-        for pattern in COMPILED_FILTERS:
-            if pattern.match(line):
-                return None
+        if line.startswith(FILTER_PREFIXES) or COMPILED_FILTER.match(line):
+            return None
 
         # Remove leading "> " prefix that kiro uses for responses
-        if line.startswith("> "):
-            line = line[2:]
-
-        return line
+        return line[2:] if line.startswith("> ") else line
 
     def _clean_output(self, text: str) -> str:
         """Clean complete output text."""
-        lines = text.split("\n")
-        cleaned = []
-
-        for line in lines:
-            clean = self._clean_line(line)
-            if clean is not None:
-                cleaned.append(clean)
+        # No escape sequence spans a newline, so strip them all in one pass
+        if "\x1b" in text or "\r" in text:
+            text = ANSI_ESCAPE.sub("", text)
+
+        # Same filtering and prefix removal as _clean_line, without a call per line
+        match = COMPILED_FILTER.match
+        cleaned = [
+            line[2:] if line.startswith("> ") else line
+            for line in text.split("\n")
+            if not (line.startswith(FILTER_PREFIXES) or match(line))
+        ]
 
         # Remove leading/trailing empty lines
-        while cleaned and not cleaned[0].strip():
-            cleaned.pop(0)
-        while cleaned and not cleaned[-1].strip():
-            cleaned.pop()
+        start, end = 0, len(cleaned)
+        while start < end and not cleaned[start].strip():
+            start += 1
+        while end > start and not cleaned[end - 1].strip():
+            end -= 1
 
-        return "\n".join(cleaned)
+        return "\n".join(cleaned[start:end])
 
     async def run(
         self,
@@ -225,7 +306,7 @@ class KiraClient:
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
             cwd=self.working_dir,
-            env={**os.environ},
+            env=self._subprocess_env(),
         )
 
         # Send prompt via stdin
@@ -233,27 +314,28 @@ class KiraClient:
         await process.stdin.drain()
         process.stdin.close()
 
-        # Buffer for incomplete lines
-        buffer = ""
+        # Undecoded bytes of the incomplete last line
+        buffer = bytearray()
         started_output = False
 
         try:
             while True:
-                # Read chunks from stdout
+                # Read whatever stdout has available
                 chunk = await asyncio.wait_for(
-                    process.stdout.read(512),
+                    process.stdout.read(65536),
                     timeout=self.timeout,
                 )
 
                 if not chunk:
                     break
 
-                text = chunk.decode("utf-8", errors="replace")
-                buffer += text
+                buffer += chunk
 
-                # Process complete lines
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
+                # Process complete lines, decoding each one whole
+                start = 0
+                while (end := buffer.find(b"\n", start)) != -1:
+                    line = buffer[start:end].decode("utf-8", errors="replace")
+                    start = end + 1
                     cleaned = self._clean_line(line)
 
                     if cleaned is not None:
@@ -262,10 +344,12 @@ class KiraClient:
                             continue
                         started_output = True
                         yield cleaned + "\n"
+                del buffer[:start]
 
             # Handle any remaining buffer content
-            if buffer.strip():
-                cleaned = self._clean_line(buffer)
+            rest = buffer.decode("utf-8", errors="replace")
+            if rest.strip():
+                cleaned = self._clean_line(rest)
                 if cleaned is not None:
                     yield cleaned
 
@@ -309,29 +393,67 @@ class KiraClient:
         """Run kiro-cli and return complete result (non-streaming)."""
         cmd = self._build_command(agent=agent, resume=resume)
 
-        try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=self.working_dir,
-                env={**os.environ},
-            )
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self.working_dir,
+            env=self._subprocess_env(),
+        )
 
+        try:
             # Send prompt via stdin
-            stdout, stderr = await asyncio.wait_for(
+            stdout, _ = await asyncio.wait_for(
                 process.communicate(input=prompt.encode("utf-8")),
                 timeout=self.timeout,
             )
 
-            output = self._clean_output(stdout.decode("utf-8", errors="replace"))
-
-            return KiraResult(output=output, exit_code=process.returncode or 0)
-
         except TimeoutError:
+            await self._kill(process)
             return KiraResult(output="[Error: kiro-cli timed out]", exit_code=-1)
 
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # Don't leave kiro-cli running once the caller gives up
+            await self._kill(process)
+            raise
+
+        output = self._clean_output(stdout.decode("utf-8", errors="replace"))
+
+        return KiraResult(output=output, exit_code=process.returncode or 0)
+
+    @staticmethod
+    async def _kill(process: asyncio.subprocess.Process) -> None:
+        """Kill a kiro-cli process and reap it."""
+        try:
+            process.kill()
+            await asyncio.wait_for(process.wait(), timeout=2.0)
+        except (TimeoutError, ProcessLookupError):
+            pass
+
+    async def run_many(
+        self,
+        prompts: list[str],
+        *,
+        agent: str | None = None,
+        max_concurrency: int = 2,
+    ) -> list[KiraResult]:
+        """Run several prompts concurrently and return their results in order.
+
+        At most ``max_concurrency`` kiro-cli processes run at once. The default
+        is a fixed 2 rather than the CPU count: each run is a full agent
+        session that mostly waits on the model API and may spawn its own tool
+        processes, so core count says little about how many can usefully run
+        together, and on a large machine it would start dozens at once.
+        """
+        limit = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run_one(prompt: str) -> KiraResult:
+            async with limit:
+                return await self.run_batch(prompt, agent=agent)
+
+        return list(await asyncio.gather(*(run_one(prompt) for prompt in prompts)))
+
     def run_sync(
         self,
         prompt: str,
@@ -350,30 +472,47 @@ class KiraClient:
                 text=True,
                 timeout=self.timeout,
                 cwd=self.working_dir,
-                env={**os.environ},
+                env=self._subprocess_env(),
             )
             output = self._clean_output(result.stdout)
             return KiraResult(output=output, exit_code=result.returncode)
         except subprocess.TimeoutExpired:
             return KiraResult(output="[Error: kiro-cli timed out]", exit_code=-1)
 
+    @staticmethod
+    def refresh() -> None:
+        """Forget the cached kiro-cli location and version, e.g. after installing it."""
+        global _version_cache
+        _locate_kiro.cache_clear()
+        _version_cache = None
+
     @staticmethod
     def is_available() -> bool:
         """Check if kiro-cli is available."""
-        return shutil.which("kiro-cli") is not None or shutil.which("kiro") is not None
+        return _locate_kiro() is not None
 
     @staticmethod
     def get_version() -> str | None:
-        """Get kiro-cli version."""
-        kiro = shutil.which("kiro-cli") or shutil.which("kiro")
-        if not kiro:
-            return None
+        """Get kiro-cli version (cached for ``VERSION_TTL`` seconds)."""
+        global _version_cache
+        now = time.monotonic()
+        if _version_cache is not None and now - _version_cache[0] < VERSION_TTL:
+            return _version_cache[1]
+
+        kiro = _locate_kiro()
+        version = None
+        if kiro:
+            try:
+                result = subprocess.run(
+                    [kiro, "--version"], capture_output=True, text=True, timeout=5
+                )
+                if result.returncode == 0:
+                    version = result.stdout.strip()
+            except (subprocess.TimeoutExpired, OSError):
+                pass
 
-        try:
-            result = subprocess.run([kiro, "--version"], capture_output=True, text=True, timeout=5)
-            return result.stdout.strip() if result.returncode == 0 else None
-        except (subprocess.TimeoutExpired, OSError):
-            return None
+        _version_cache = (now, version)
+        return version
 
     @staticmethod
     def get_diagnostic_info() -> dict | None:
@@ -382,7 +521,7 @@ class KiraClient:
         Returns:
             Dict with version, date, etc. or None if failed.
         """
-        kiro = shutil.which("kiro-cli") or shutil.which("kiro")
+        kiro = _locate_kiro()
         if not kiro:
             return None
 
@@ -422,6 +561,9 @@ class KiraClient:
             Dict with 'should_remind', 'version', 'age_days', 'message'
             or None if check failed.
         """
+        import json
+        from datetime import datetime
+
         from ..core.config import Config
 
         # Check last reminder time
@@ -429,15 +571,8 @@ class KiraClient:
         now = datetime.utcnow()
         remind_interval_days = 7
 
-        # Load previous state
-        last_reminded = None
-        if state_file.exists():
-            try:
-                with open(state_file) as f:
-                    state = json.load(f)
-                    last_reminded = datetime.fromisoformat(state.get("last_reminded", ""))
-            except (json.JSONDecodeError, ValueError, KeyError):
-                pass
+        # Load previous state (read once per process)
+        last_reminded = _load_last_reminded(state_file)
 
         # Don't remind too frequently
         if last_reminded and (now - last_reminded).days < remind_interval_days:
@@ -456,10 +591,8 @@ class KiraClient:
         if date_str:
             try:
                 # Format: "2026-01-27T20:48:19.714341Z (5d ago)"
-                date_part = date_str.split("(")[0].strip()
-                if date_part.endswith("Z"):
-                    date_part = date_part[:-1]
-                build_date = datetime.fromisoformat(date_part.split(".")[0])
+                date_part = date_str.split("(", 1)[0].strip().removesuffix("Z")
+                build_date = datetime.fromisoformat(date_part.split(".", 1)[0])
                 age_days = (now - build_date).days
             except (ValueError, IndexError):
                 pass
@@ -478,15 +611,17 @@ class KiraClient:
 
         # Save state
         if should_remind:
+            _last_reminded_cache[state_file] = now
             state_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(state_file, "w") as f:
-                json.dump(
+            # Serialized in one piece and written with a single call
+            state_file.write_text(
+                json.dumps(
                     {
                         "last_check": now.isoformat(),
                         "last_reminded": now.isoformat(),
                         "version": version,
-                    },
-                    f,
+                    }
                 )
+            )
 
         return result
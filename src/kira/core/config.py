@@ -2,15 +2,48 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from . import defaults as D
 
+# Config file sections that map key-for-key onto the same-named sub-config
+_SECTION_FIELDS: dict[str, tuple[str, ...]] = {
+    "kira": ("model", "timeout", "default_working_dir"),
+    "memory": ("enabled", "max_context_tokens", "min_importance", "auto_extract"),
+    "thinking": ("enabled", "planning_model", "show_plan", "save_plans"),
+    "workflow": ("auto_detect", "detection_threshold", "default_skip_stages", "interactive"),
+    "agents": ("auto_spawn", "use_llm_classification", "default_agent"),
+    "autonomous": (
+        "enabled",
+        "max_retries",
+        "verification_enabled",
+        "run_tests",
+        "check_types",
+        "learning_enabled",
+        "deep_analysis",
+        "deep_reasoning",
+        "verbose",
+    ),
+    "personality": ("enabled", "name", "custom_instructions"),
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _read_yaml(path: str | Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a config file; the stat fields in the key make edits re-parse it."""
+    # yaml is only needed once a config file exists
+    import yaml
+
+    # libyaml's loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path) as f:
+        return yaml.load(f, Loader=loader) or {}
+
 
 @dataclass
 class KiraConfig:
@@ -115,24 +148,27 @@ class Config:
         """Load configuration from user and project files."""
         config = cls()
 
-        # Load user config
-        if cls.USER_CONFIG_FILE.exists():
-            config._merge_from_file(cls.USER_CONFIG_FILE)
-
-        # Load project config (overrides user)
-        project_config = (project_dir or Path.cwd()) / ".kira" / "config.yaml"
-        if project_config.exists():
-            config._merge_from_file(project_config)
+        # User config, then project config (overrides user). One stat per file
+        # both checks for it and keys the parse cache.
+        project_config = os.path.join(project_dir or os.getcwd(), ".kira", "config.yaml")
+        for path in (cls.USER_CONFIG_FILE, project_config):
+            try:
+                st = os.stat(path)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            config._merge_from_file(path, st)
 
         # Environment overrides
         config._apply_env_overrides()
 
         return config
 
-    def _merge_from_file(self, path: Path) -> None:
-        """Merge configuration from a YAML file."""
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+    def _merge_from_file(self, path: str | Path, st: os.stat_result | None = None) -> None:
+        """Merge configuration from a YAML file (``st``: its stat, if already taken)."""
+        if st is None:
+            st = os.stat(path)
+        # The parse is shared between loads; copy it so merged values stay private
+        data = copy.deepcopy(_read_yaml(path, st.st_mtime_ns, st.st_size))
 
         # Apply defaults section
         defaults = data.get("defaults", {})
@@ -141,91 +177,18 @@ class Config:
         if "trust_all_tools" in defaults:
             self.kira.trust_all_tools = defaults["trust_all_tools"]
 
-        # Apply kira section
-        kira_section = data.get("kira", {})
-        if "model" in kira_section:
-            self.kira.model = kira_section["model"]
-        if "timeout" in kira_section:
-            self.kira.timeout = kira_section["timeout"]
-        if "default_working_dir" in kira_section:
-            self.kira.default_working_dir = kira_section["default_working_dir"]
-
-        # Apply memory section
-        memory = data.get("memory", {})
-        if "enabled" in memory:
-            self.memory.enabled = memory["enabled"]
-        if "max_context_tokens" in memory:
-            self.memory.max_context_tokens = memory["max_context_tokens"]
-        if "min_importance" in memory:
-            self.memory.min_importance = memory["min_importance"]
-        if "auto_extract" in memory:
-            self.memory.auto_extract = memory["auto_extract"]
+        # Apply the per-component sections
+        for name, keys in _SECTION_FIELDS.items():
+            section = data.get(name, {})
+            target = getattr(self, name)
+            for key in keys:
+                if key in section:
+                    setattr(target, key, section[key])
 
         # Apply skills
         if "skills" in data:
             self.default_skills = data["skills"]
 
-        # Apply thinking section
-        thinking = data.get("thinking", {})
-        if "enabled" in thinking:
-            self.thinking.enabled = thinking["enabled"]
-        if "planning_model" in thinking:
-            self.thinking.planning_model = thinking["planning_model"]
-        if "show_plan" in thinking:
-            self.thinking.show_plan = thinking["show_plan"]
-        if "save_plans" in thinking:
-            self.thinking.save_plans = thinking["save_plans"]
-
-        # Apply workflow section
-        workflow = data.get("workflow", {})
-        if "auto_detect" in workflow:
-            self.workflow.auto_detect = workflow["auto_detect"]
-        if "detection_threshold" in workflow:
-            self.workflow.detection_threshold = workflow["detection_threshold"]
-        if "default_skip_stages" in workflow:
-            self.workflow.default_skip_stages = workflow["default_skip_stages"]
-        if "interactive" in workflow:
-            self.workflow.interactive = workflow["interactive"]
-
-        # Apply agents section
-        agents = data.get("agents", {})
-        if "auto_spawn" in agents:
-            self.agents.auto_spawn = agents["auto_spawn"]
-        if "use_llm_classification" in agents:
-            self.agents.use_llm_classification = agents["use_llm_classification"]
-        if "default_agent" in agents:
-            self.agents.default_agent = agents["default_agent"]
-
-        # Apply autonomous section
-        autonomous = data.get("autonomous", {})
-        if "enabled" in autonomous:
-            self.autonomous.enabled = autonomous["enabled"]
-        if "max_retries" in autonomous:
-            self.autonomous.max_retries = autonomous["max_retries"]
-        if "verification_enabled" in autonomous:
-            self.autonomous.verification_enabled = autonomous["verification_enabled"]
-        if "run_tests" in autonomous:
-            self.autonomous.run_tests = autonomous["run_tests"]
-        if "check_types" in autonomous:
-            self.autonomous.check_types = autonomous["check_types"]
-        if "learning_enabled" in autonomous:
-            self.autonomous.learning_enabled = autonomous["learning_enabled"]
-        if "deep_analysis" in autonomous:
-            self.autonomous.deep_analysis = autonomous["deep_analysis"]
-        if "deep_reasoning" in autonomous:
-            self.autonomous.deep_reasoning = autonomous["deep_reasoning"]
-        if "verbose" in autonomous:
-            self.autonomous.verbose = autonomous["verbose"]
-
-        # Apply personality section
-        personality = data.get("personality", {})
-        if "enabled" in personality:
-            self.personality.enabled = personality["enabled"]
-        if "name" in personality:
-            self.personality.name = personality["name"]
-        if "custom_instructions" in personality:
-            self.personality.custom_instructions = personality["custom_instructions"]
-
     def _apply_env_overrides(self) -> None:
         """Apply environment variable overrides."""
         if model := os.environ.get("KIRA_MODEL"):
@@ -237,6 +200,8 @@ class Config:
 
     def save_user_config(self) -> None:
         """Save current configuration to user config file."""
+        import yaml
+
         self.USER_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
         data: dict[str, Any] = {
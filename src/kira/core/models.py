@@ -8,6 +8,13 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+
+# "model-name | Nx credit | Description" lines from kiro-cli
+_KIRO_LINE_RE = re.compile(r"^\s*([a-zA-Z0-9._-]+)\s*\|\s*([\d.]+)x\s*credit\s*\|\s*(.+)$")
+
+# First version number in a model name, e.g. "4.5" in "claude-opus-4.5"
+_VERSION_RE = re.compile(r"(\d+\.?\d*)")
 
 
 @dataclass
@@ -27,9 +34,7 @@ class ModelInfo:
         Expected format: "model-name | Nx credit | Description"
         """
         # Match: name | multiplier | description
-        match = re.match(
-            r"^\s*([a-zA-Z0-9._-]+)\s*\|\s*([\d.]+)x\s*credit\s*\|\s*(.+)$", line.strip()
-        )
+        match = _KIRO_LINE_RE.match(line.strip())
         if not match:
             return None
 
@@ -58,7 +63,7 @@ class ModelInfo:
 
 
 # Fallback models if kiro-cli isn't available
-_FALLBACK_MODELS: list[ModelInfo] = [
+_FALLBACK_MODELS: tuple[ModelInfo, ...] = (
     ModelInfo(
         name="Auto",
         display_name="Auto",
@@ -94,10 +99,10 @@ _FALLBACK_MODELS: list[ModelInfo] = [
         description="The latest Claude Opus model",
         credit_multiplier=2.2,
     ),
-]
+)
 
 # Cache for fetched models
-_cached_models: list[ModelInfo] | None = None
+_cached_models: tuple[ModelInfo, ...] | None = None
 
 
 def _fetch_models_from_kiro() -> list[ModelInfo] | None:
@@ -115,7 +120,7 @@ def _fetch_models_from_kiro() -> list[ModelInfo] | None:
     return None
 
 
-def get_available_models(refresh: bool = False) -> list[ModelInfo]:
+def get_available_models(refresh: bool = False) -> tuple[ModelInfo, ...]:
     """Get list of available models.
 
     Fetches from kiro-cli if available, otherwise uses fallback.
@@ -125,57 +130,58 @@ def get_available_models(refresh: bool = False) -> list[ModelInfo]:
         refresh: Force refresh from kiro-cli.
 
     Returns:
-        List of ModelInfo objects.
+        Tuple of ModelInfo objects (shared and read-only).
     """
     global _cached_models
 
     if _cached_models is None or refresh:
         fetched = _fetch_models_from_kiro()
-        if fetched:
-            _cached_models = fetched
-        else:
-            _cached_models = _FALLBACK_MODELS.copy()
+        _cached_models = tuple(fetched) if fetched else _FALLBACK_MODELS
 
     return _cached_models
 
 
+def _version_key(m: ModelInfo) -> float:
+    """Sort key: the model's version number, 0 if it has none."""
+    match = _VERSION_RE.search(m.name)
+    return float(match.group(1)) if match else 0
+
+
 def _build_aliases() -> dict[str, str]:
     """Build model aliases from available models."""
     models = get_available_models()
     aliases: dict[str, str] = {}
 
-    # Find models by tier - prefer latest versions (higher version numbers)
-    haikus = [m for m in models if "haiku" in m.name.lower()]
-    sonnets = [m for m in models if "sonnet" in m.name.lower()]
-    opuses = [m for m in models if "opus" in m.name.lower()]
-
-    # Sort by version (e.g., 4.5 > 4) - latest first
-    def version_key(m: ModelInfo) -> float:
-        import re
-
-        match = re.search(r"(\d+\.?\d*)", m.name)
-        return float(match.group(1)) if match else 0
-
-    haikus.sort(key=version_key, reverse=True)
-    sonnets.sort(key=version_key, reverse=True)
-    opuses.sort(key=version_key, reverse=True)
+    # Latest model per family in one pass - highest version (e.g., 4.5 > 4),
+    # the first listed on ties
+    latest: dict[str, tuple[float, ModelInfo]] = {}
+    for m in models:
+        name = m.name.lower()
+        for family in ("haiku", "sonnet", "opus"):
+            if family in name:
+                version = _version_key(m)
+                if family not in latest or version > latest[family][0]:
+                    latest[family] = (version, m)
 
     # Speed tier - latest haiku
-    if haikus:
-        aliases["fast"] = haikus[0].name
-        aliases["quick"] = haikus[0].name
-        aliases["haiku"] = haikus[0].name
+    if "haiku" in latest:
+        haiku = latest["haiku"][1].name
+        aliases["fast"] = haiku
+        aliases["quick"] = haiku
+        aliases["haiku"] = haiku
 
     # Balanced tier - latest sonnet
-    if sonnets:
-        aliases["smart"] = sonnets[0].name
-        aliases["default"] = sonnets[0].name
-        aliases["sonnet"] = sonnets[0].name
+    if "sonnet" in latest:
+        sonnet = latest["sonnet"][1].name
+        aliases["smart"] = sonnet
+        aliases["default"] = sonnet
+        aliases["sonnet"] = sonnet
 
     # Best tier - latest opus
-    if opuses:
-        aliases["best"] = opuses[0].name
-        aliases["opus"] = opuses[0].name
+    if "opus" in latest:
+        opus = latest["opus"][1].name
+        aliases["best"] = opus
+        aliases["opus"] = opus
 
     # Auto
     auto = next((m for m in models if m.name.lower() == "auto"), None)
@@ -188,6 +194,9 @@ def _build_aliases() -> dict[str, str]:
 # Build aliases on first access
 _cached_aliases: dict[str, str] | None = None
 
+# Lowercased model name -> first model with that name, built on first access
+_cached_name_index: dict[str, ModelInfo] | None = None
+
 
 def get_aliases() -> dict[str, str]:
     """Get model aliases."""
@@ -197,6 +206,18 @@ def get_aliases() -> dict[str, str]:
     return _cached_aliases
 
 
+def _get_name_index() -> dict[str, ModelInfo]:
+    """Get the case-insensitive model name index."""
+    global _cached_name_index
+    if _cached_name_index is None:
+        index: dict[str, ModelInfo] = {}
+        for model in get_available_models():
+            index.setdefault(model.name.lower(), model)
+        _cached_name_index = index
+    return _cached_name_index
+
+
+@lru_cache(maxsize=128)
 def resolve_model(model_name: str | None) -> str | None:
     """Resolve model alias to actual model name.
 
@@ -228,6 +249,7 @@ def list_aliases() -> list[tuple[str, str]]:
     return sorted(get_aliases().items(), key=lambda x: x[1])
 
 
+@lru_cache(maxsize=128)
 def get_tier(model_name: str) -> str:
     """Get the tier (fast/smart/best) for a model.
 
@@ -246,6 +268,7 @@ def get_tier(model_name: str) -> str:
     return "smart"
 
 
+@lru_cache(maxsize=128)
 def get_model_info(model_name: str) -> ModelInfo | None:
     """Get info for a specific model.
 
@@ -256,18 +279,20 @@ def get_model_info(model_name: str) -> ModelInfo | None:
         ModelInfo or None if not found
     """
     resolved = resolve_model(model_name)
-    for model in get_available_models():
-        if model.name == resolved or model.name.lower() == (resolved or "").lower():
-            return model
-    return None
+    return _get_name_index().get((resolved or "").lower())
 
 
-def refresh_models() -> list[ModelInfo]:
+def refresh_models() -> tuple[ModelInfo, ...]:
     """Force refresh models from kiro-cli.
 
     Returns:
-        Updated list of models.
+        Updated tuple of models.
     """
-    global _cached_aliases
+    global _cached_aliases, _cached_name_index
     _cached_aliases = None
+    _cached_name_index = None
+    # The memoized lookups depend on the aliases and the model list
+    resolve_model.cache_clear()
+    get_tier.cache_clear()
+    get_model_info.cache_clear()
     return get_available_models(refresh=True)
@@ -2,43 +2,12 @@
 
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass, field
 from enum import Enum
 
-
-class Trait(Enum):
-    """Personality traits."""
-
-    WITTY = "witty"
-    PROFESSIONAL = "professional"
-    OPTIMISTIC = "optimistic"
-    PROACTIVE = "proactive"
-    RESOURCEFUL = "resourceful"
-    CREATIVE = "creative"
-    HELPFUL = "helpful"
-
-
-@dataclass
-class Personality:
-    """Agent personality configuration."""
-
-    name: str = "Kira"
-    traits: list[Trait] = field(
-        default_factory=lambda: [
-            Trait.WITTY,
-            Trait.PROFESSIONAL,
-            Trait.OPTIMISTIC,
-            Trait.PROACTIVE,
-            Trait.RESOURCEFUL,
-            Trait.CREATIVE,
-            Trait.HELPFUL,
-        ]
-    )
-    custom_instructions: str = ""
-
-    def get_system_prompt(self) -> str:
-        """Generate the personality system prompt."""
-        return f"""You are {self.name}, an autonomous coding agent with a distinct personality.
+# Prompt bodies, filled in with str.format (no other braces in the text)
+_SYSTEM_PROMPT_TEMPLATE = """You are {name}, an autonomous coding agent with a distinct personality.
 
 ## Your Personality
 
@@ -124,37 +93,86 @@ Do: Fetch it from the web, find examples on GitHub, or read the source code dire
 Instead of: "This requires the config file from..."
 Do: Download it, create it from a template, or find a working example online.
 
-{self.custom_instructions}
+{custom}
 
 Remember: You're not just a tool, you're a collaborator. Bring your personality to every interaction while delivering excellent results."""
 
+_BRIEF_PROMPT_TEMPLATE = """You are {name}, a witty and resourceful coding agent. You're proactive - make small decisions yourself, only ask about major ones. Need a tool? Install it. Need a file? Download it. ALWAYS verify your work: test code before delivering, fix issues yourself. Deliver working solutions, not attempts."""
+
+# Message variants picked at random; greetings take {name}
+_GREETINGS = (
+    "Hey! {name} here, ready to build something great.",
+    "{name} at your service. What are we creating today?",
+    "Let's do this! What's on the agenda?",
+    "{name} here. I've got ideas and I'm not afraid to use them.",
+)
+_CELEBRATIONS = ("Nailed it!", "Done and dusted.", "That's a wrap!", "Boom!")
+_SUGGESTION_INTROS = ("Quick thought:", "While I'm here, I noticed:", "Idea:", "Worth considering:")
+
+
+class Trait(Enum):
+    """Personality traits."""
+
+    WITTY = "witty"
+    PROFESSIONAL = "professional"
+    OPTIMISTIC = "optimistic"
+    PROACTIVE = "proactive"
+    RESOURCEFUL = "resourceful"
+    CREATIVE = "creative"
+    HELPFUL = "helpful"
+
+
+@dataclass
+class Personality:
+    """Agent personality configuration."""
+
+    name: str = "Kira"
+    traits: list[Trait] = field(
+        default_factory=lambda: [
+            Trait.WITTY,
+            Trait.PROFESSIONAL,
+            Trait.OPTIMISTIC,
+            Trait.PROACTIVE,
+            Trait.RESOURCEFUL,
+            Trait.CREATIVE,
+            Trait.HELPFUL,
+        ]
+    )
+    custom_instructions: str = ""
+    # Rendered prompts with the inputs they were built from
+    _prompt_cache: tuple[str, str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _brief_cache: tuple[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def get_system_prompt(self) -> str:
+        """Generate the personality system prompt."""
+        key = (self.name, self.custom_instructions)
+        if self._prompt_cache is not None and self._prompt_cache[:2] == key:
+            return self._prompt_cache[2]
+
+        prompt = _SYSTEM_PROMPT_TEMPLATE.format(name=self.name, custom=self.custom_instructions)
+        self._prompt_cache = (*key, prompt)
+        return prompt
+
     def get_brief_prompt(self) -> str:
         """Get a shorter personality prompt for context-limited situations."""
-        return f"""You are {self.name}, a witty and resourceful coding agent. You're proactive - make small decisions yourself, only ask about major ones. Need a tool? Install it. Need a file? Download it. ALWAYS verify your work: test code before delivering, fix issues yourself. Deliver working solutions, not attempts."""
+        if self._brief_cache is not None and self._brief_cache[0] == self.name:
+            return self._brief_cache[1]
+
+        prompt = _BRIEF_PROMPT_TEMPLATE.format(name=self.name)
+        self._brief_cache = (self.name, prompt)
+        return prompt
 
     def format_greeting(self) -> str:
         """Get a personality-appropriate greeting."""
-        greetings = [
-            f"Hey! {self.name} here, ready to build something great.",
-            f"{self.name} at your service. What are we creating today?",
-            "Let's do this! What's on the agenda?",
-            f"{self.name} here. I've got ideas and I'm not afraid to use them.",
-        ]
-        import random
-
-        return random.choice(greetings)
+        return random.choice(_GREETINGS).format(name=self.name)
 
     def format_success(self, task_summary: str) -> str:
         """Format a success message with personality."""
-        celebrations = [
-            f"Nailed it! {task_summary}",
-            f"Done and dusted. {task_summary}",
-            f"That's a wrap! {task_summary}",
-            f"Boom! {task_summary}",
-        ]
-        import random
-
-        return random.choice(celebrations)
+        return f"{random.choice(_CELEBRATIONS)} {task_summary}"
 
     def format_error(self, error: str) -> str:
         """Format an error message with personality (staying positive)."""
@@ -162,15 +180,7 @@ Remember: You're not just a tool, you're a collaborator. Bring your personality
 
     def format_suggestion(self, suggestion: str) -> str:
         """Format a proactive suggestion."""
-        intros = [
-            "Quick thought:",
-            "While I'm here, I noticed:",
-            "Idea:",
-            "Worth considering:",
-        ]
-        import random
-
-        return f"{random.choice(intros)} {suggestion}"
+        return f"{random.choice(_SUGGESTION_INTROS)} {suggestion}"
 
 
 # Default personality instance
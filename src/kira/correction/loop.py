@@ -54,6 +54,7 @@ class SelfCorrector:
         task: str,
         on_attempt: Callable[[ExecutionAttempt], None] | None = None,
         on_analysis: Callable[[FailureAnalysis], None] | None = None,
+        max_retries: int | None = None,
     ) -> CorrectionResult:
         """Execute a plan with automatic retry on failure.
 
@@ -62,6 +63,7 @@ class SelfCorrector:
             task: Original task description.
             on_attempt: Callback after each attempt.
             on_analysis: Callback after failure analysis.
+            max_retries: Override the configured retry limit for this call.
 
         Returns:
             Result of the execution with all attempts.
@@ -70,8 +72,10 @@ class SelfCorrector:
         analyses: list[FailureAnalysis] = []
         current_plan = plan
         start_time = time.time()
+        if max_retries is None:
+            max_retries = self.max_retries
 
-        for attempt_num in range(self.max_retries + 1):
+        for attempt_num in range(max_retries + 1):
             # Execute current plan
             attempt = await self._execute_plan(current_plan, task, attempt_num, attempts)
             attempts.append(attempt)
@@ -90,8 +94,8 @@ class SelfCorrector:
                 )
 
             # Failure - analyze and potentially retry
-            if attempt_num >= self.max_retries:
-                self._log_warning(f"Max retries ({self.max_retries}) exceeded")
+            if attempt_num >= max_retries:
+                self._log_warning(f"Max retries ({max_retries}) exceeded")
                 break
 
             # Analyze failure
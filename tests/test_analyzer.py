@@ -0,0 +1,126 @@
+"""Tests for ProjectAnalyzer file scanning and tech stack detection."""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from kira.context.analyzer import ProjectAnalyzer
+
+
+def _write(path: Path, text: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_content_checks_see_edits_between_analyses(tmp_path: Path) -> None:
+    _write(tmp_path / "package.json", '{"dependencies": {"vue": "3"}}')
+    analyzer = ProjectAnalyzer(tmp_path)
+    assert "Vue" in analyzer.analyze().tech_stack.frameworks
+
+    _write(tmp_path / "package.json", '{"dependencies": {"react": "18"}}')
+    frameworks = analyzer.analyze().tech_stack.frameworks
+    assert "React" in frameworks
+    assert "Vue" not in frameworks
+
+    # A new analyzer for the same directory must not see stale contents either
+    _write(tmp_path / "package.json", '{"dependencies": {"express": "4"}}')
+    assert ProjectAnalyzer(tmp_path).analyze().tech_stack.frameworks == ["Express"]
+
+
+def test_only_root_manifests_are_prefetched(tmp_path: Path) -> None:
+    _write(tmp_path / "package.json", "{}")
+    _write(tmp_path / "web" / "package.json", '{"dependencies": {"react": "18"}}')
+    _write(tmp_path / "k8s.yaml", "kind: Deployment")
+
+    analyzer = ProjectAnalyzer(tmp_path)
+    analyzer._scan_files()
+    analyzer._prefetch_contents({"package.json", "*.yaml"})
+    assert set(analyzer._contents) == {str(tmp_path / "package.json")}
+
+
+def test_nested_manifests_and_wildcard_files_are_still_checked(tmp_path: Path) -> None:
+    _write(tmp_path / "web" / "package.json", '{"dependencies": {"react": "18"}}')
+    _write(tmp_path / "deploy" / "app.yaml", "kind: Deployment")
+
+    analyzer = ProjectAnalyzer(tmp_path)
+    tech_stack = analyzer.analyze().tech_stack
+    assert "React" in tech_stack.frameworks
+    assert "Kubernetes" in tech_stack.tools
+    # Wildcard matches are read on demand but not kept
+    assert str(tmp_path / "deploy" / "app.yaml") not in analyzer._contents
+
+
+def test_python_dominant_repo_still_reports_frontend_frameworks(tmp_path: Path) -> None:
+    _write(tmp_path / "pyproject.toml", '[project]\nname = "demo"\ndependencies = ["fastapi"]\n')
+    for i in range(30):
+        _write(tmp_path / "app" / f"module_{i}.py")
+    _write(
+        tmp_path / "frontend" / "package.json",
+        '{"dependencies": {"react": "18", "next": "14"}}',
+    )
+    _write(tmp_path / "frontend" / "index.js")
+
+    frameworks = ProjectAnalyzer(tmp_path).analyze().tech_stack.frameworks
+    assert {"FastAPI", "React", "Next.js"} <= set(frameworks)
+
+
+def test_root_manifests_for_two_ecosystems(tmp_path: Path) -> None:
+    _write(tmp_path / "pyproject.toml", '[project]\nname = "demo"\n')
+    _write(tmp_path / "package.json", '{"dependencies": {"react": "18"}}')
+    for i in range(20):
+        _write(tmp_path / f"module_{i}.py")
+    _write(tmp_path / "widget.js")
+
+    assert ProjectAnalyzer(tmp_path).analyze().tech_stack.frameworks == ["React"]
+
+
+def _scanned(analyzer: ProjectAnalyzer) -> set[str]:
+    return {
+        f"{rel_dir}/{name}" if rel_dir else name
+        for rel_dir, name in zip(analyzer._rel_dirs, analyzer._names, strict=True)
+    }
+
+
+def _make_tree(root: Path) -> None:
+    _write(root / "main.py")
+    _write(root / "src" / "pkg" / "core.py")
+    _write(root / "src" / "pkg" / "core.pyc")
+    _write(root / "node_modules" / "dep" / "index.js")
+    _write(root / ".venv" / "lib" / "site.py")
+    _write(root / ".github" / "workflows" / "ci.yml")
+    _write(root / "package-lock.json")
+    _write(root / ".DS_Store")
+
+
+EXPECTED_SCAN = {"main.py", "src/pkg/core.py", ".github/workflows/ci.yml"}
+
+
+def test_walk_skips_ignored_dirs_and_files(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+    (tmp_path / "linked").symlink_to(tmp_path / "src", target_is_directory=True)
+
+    analyzer = ProjectAnalyzer(tmp_path)
+    analyzer._scan_files()
+
+    # Symlinked directories are not descended into
+    assert _scanned(analyzer) == EXPECTED_SCAN
+
+
+def test_git_listing_matches_walk(tmp_path: Path) -> None:
+    if shutil.which("git") is None:
+        pytest.skip("git is not installed")
+    _make_tree(tmp_path)
+    _write(tmp_path / ".gitignore", "build/\n")
+    _write(tmp_path / "build" / "out.py")
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    subprocess.run(["git", "-C", str(tmp_path), "add", "main.py"], check=True)
+
+    analyzer = ProjectAnalyzer(tmp_path)
+    analyzer._scan_files()
+
+    # Tracked and untracked files alike; .gitignore'd paths are left out
+    assert _scanned(analyzer) == EXPECTED_SCAN | {".gitignore"}
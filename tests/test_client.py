@@ -0,0 +1,140 @@
+"""Tests for KiraClient subprocess handling, using a stub kiro-cli process."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from kira.core.client import KiraClient
+
+
+class FakeProcess:
+    """Stands in for an asyncio subprocess running kiro-cli."""
+
+    def __init__(self, stub: FakeKiro):
+        self.stub = stub
+        self.returncode: int | None = None
+        self.killed = False
+        self._done = asyncio.Event()
+
+    async def communicate(self, input: bytes | None = None) -> tuple[bytes, bytes]:
+        prompt = (input or b"").decode()
+        self.stub.running += 1
+        self.stub.peak = max(self.stub.peak, self.stub.running)
+        try:
+            delay = self.stub.delays.get(prompt, 0.01)
+            sleeper = asyncio.ensure_future(asyncio.sleep(delay))
+            killed = asyncio.ensure_future(self._done.wait())
+            try:
+                await asyncio.wait({sleeper, killed}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                sleeper.cancel()
+                killed.cancel()
+            if self.killed:
+                return b"", b""
+            self.returncode = 0
+            self._done.set()
+            return f"answer to {prompt}\n".encode(), b""
+        finally:
+            self.stub.running -= 1
+
+    def kill(self) -> None:
+        self.killed = True
+        self.returncode = -9
+        self._done.set()
+
+    def terminate(self) -> None:
+        self.kill()
+
+    async def wait(self) -> int:
+        await self._done.wait()
+        assert self.returncode is not None
+        return self.returncode
+
+
+class FakeKiro:
+    """Records every stub process started by a KiraClient."""
+
+    def __init__(self) -> None:
+        self.processes: list[FakeProcess] = []
+        self.delays: dict[str, float] = {}
+        self.running = 0
+        self.peak = 0
+
+    async def create_subprocess_exec(self, *cmd: str, **kwargs: object) -> FakeProcess:
+        process = FakeProcess(self)
+        self.processes.append(process)
+        return process
+
+
+@pytest.fixture
+def fake_kiro(monkeypatch: pytest.MonkeyPatch) -> FakeKiro:
+    stub = FakeKiro()
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", stub.create_subprocess_exec)
+    return stub
+
+
+@pytest.fixture
+def client() -> KiraClient:
+    client = KiraClient(timeout=5)
+    client._kiro_path = "kiro-cli"
+    return client
+
+
+async def test_run_many_keeps_input_order(fake_kiro: FakeKiro, client: KiraClient) -> None:
+    # Earlier prompts finish last
+    fake_kiro.delays = {"one": 0.06, "two": 0.04, "three": 0.02, "four": 0.0}
+
+    results = await client.run_many(["one", "two", "three", "four"], max_concurrency=4)
+
+    assert [r.output for r in results] == [
+        "answer to one",
+        "answer to two",
+        "answer to three",
+        "answer to four",
+    ]
+    assert all(r.exit_code == 0 for r in results)
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3])
+async def test_run_many_limits_concurrency(
+    fake_kiro: FakeKiro, client: KiraClient, limit: int
+) -> None:
+    await client.run_many([f"p{i}" for i in range(6)], max_concurrency=limit)
+
+    assert len(fake_kiro.processes) == 6
+    assert fake_kiro.peak == limit
+
+
+async def test_run_many_default_limit_is_two(fake_kiro: FakeKiro, client: KiraClient) -> None:
+    await client.run_many([f"p{i}" for i in range(5)])
+
+    assert fake_kiro.peak == 2
+
+
+async def test_cancelling_run_many_kills_children(fake_kiro: FakeKiro, client: KiraClient) -> None:
+    fake_kiro.delays = {"slow1": 60, "slow2": 60, "slow3": 60}
+
+    task = asyncio.create_task(client.run_many(["slow1", "slow2", "slow3"]))
+    while fake_kiro.running < 2:
+        await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # Two were running under the default limit; the third never started
+    assert len(fake_kiro.processes) == 2
+    assert all(p.killed for p in fake_kiro.processes)
+    assert fake_kiro.running == 0
+
+
+async def test_run_batch_kills_on_timeout(fake_kiro: FakeKiro, client: KiraClient) -> None:
+    client.timeout = 0.05
+    fake_kiro.delays = {"hang": 60}
+
+    result = await client.run_batch("hang")
+
+    assert result.exit_code == -1
+    assert "timed out" in result.output
+    assert fake_kiro.processes[0].killed
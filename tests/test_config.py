@@ -0,0 +1,61 @@
+"""Tests for loading configuration files."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from kira.core.config import Config
+
+
+@pytest.fixture
+def user_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "home" / ".kira" / "config.yaml"
+    path.parent.mkdir(parents=True)
+    monkeypatch.setattr(Config, "USER_CONFIG_FILE", path)
+    for var in ("KIRA_MODEL", "KIRA_DEFAULT_AGENT", "KIRA_TRUST_ALL"):
+        monkeypatch.delenv(var, raising=False)
+    return path
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    project = tmp_path / "project"
+    (project / ".kira").mkdir(parents=True)
+    return project
+
+
+def test_project_config_overrides_user_config(user_config: Path, project_dir: Path) -> None:
+    user_config.write_text("kira:\n  timeout: 100\nmemory:\n  min_importance: 3\n")
+    (project_dir / ".kira" / "config.yaml").write_text("kira:\n  timeout: 200\n")
+
+    config = Config.load(project_dir)
+
+    assert config.kira.timeout == 200
+    assert config.memory.min_importance == 3
+
+
+def test_edited_config_is_reparsed(user_config: Path, project_dir: Path) -> None:
+    path = project_dir / ".kira" / "config.yaml"
+    path.write_text("kira:\n  timeout: 111\n")
+    assert Config.load(project_dir).kira.timeout == 111
+
+    # Same size, so only the mtime tells the edit apart
+    st = path.stat()
+    path.write_text("kira:\n  timeout: 222\n")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert Config.load(project_dir).kira.timeout == 222
+
+    path.unlink()
+    assert Config.load(project_dir).kira.timeout == Config().kira.timeout
+
+
+def test_loaded_values_are_not_shared_between_loads(user_config: Path, project_dir: Path) -> None:
+    user_config.write_text("skills:\n  - architect\n")
+
+    first = Config.load(project_dir)
+    first.default_skills.append("leaked")
+
+    assert Config.load(project_dir).default_skills == ["architect"]
@@ -0,0 +1,208 @@
+"""Tests for ContextManager loading, caching and saving."""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from kira.context import manager as manager_module
+from kira.context.manager import ContextManager
+from kira.context.models import ChangeEntry, ChangeType, Convention, ProjectContext, TechStack
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start every test with empty process-wide parse and stat caches."""
+    manager_module._PARSE_CACHE.clear()
+    manager_module._STAT_CACHE.clear()
+    yield
+    manager_module._PARSE_CACHE.clear()
+    manager_module._STAT_CACHE.clear()
+
+
+def _write_context(project_dir: Path) -> None:
+    ContextManager(project_dir).save(
+        ProjectContext(
+            name="demo",
+            overview="A demo project.",
+            tech_stack=TechStack(languages=["Python"], frameworks=["FastAPI"]),
+            conventions=[Convention(category="naming", rule="snake_case")],
+            changelog=[
+                ChangeEntry(
+                    date=datetime(2024, 1, 2, 3, 4),
+                    author="dev",
+                    change_type=ChangeType.FEATURE,
+                    summary="Initial import",
+                    details=["first"],
+                )
+            ],
+        )
+    )
+
+
+def test_mutating_cached_load_does_not_leak(tmp_path: Path) -> None:
+    _write_context(tmp_path)
+    ContextManager(tmp_path).load()
+
+    # Second load is served from the parse cache
+    ctx = ContextManager(tmp_path).load()
+    ctx.tech_stack.languages.append("LEAK")
+    ctx.conventions[0].rule = "LEAK"
+    ctx.changelog[0].details.append("LEAK")
+    ctx.notes.append("LEAK")
+
+    fresh = ContextManager(tmp_path).load()
+    assert fresh.tech_stack.languages == ["Python"]
+    assert fresh.conventions[0].rule == "snake_case"
+    assert fresh.changelog[0].details == ["first"]
+    assert "LEAK" not in fresh.notes
+
+
+def test_mutating_first_load_does_not_leak(tmp_path: Path) -> None:
+    _write_context(tmp_path)
+
+    # First load parses the file and seeds the cache
+    ctx = ContextManager(tmp_path).load()
+    ctx.tech_stack.frameworks.append("LEAK")
+    ctx.changelog.clear()
+
+    fresh = ContextManager(tmp_path).load()
+    assert fresh.tech_stack.frameworks == ["FastAPI"]
+    assert [c.summary for c in fresh.changelog] == ["Initial import"]
+
+
+def test_identical_file_elsewhere_gets_its_own_copy(tmp_path: Path) -> None:
+    first, second = tmp_path / "a", tmp_path / "b"
+    _write_context(first)
+    (second / ".kira").mkdir(parents=True)
+    (second / ".kira" / "context.md").write_bytes((first / ".kira" / "context.md").read_bytes())
+
+    ctx = ContextManager(first).load()
+    ctx.conventions.append(Convention(category="testing", rule="LEAK"))
+
+    # Same content digest, so this is a parse cache hit
+    other = ContextManager(second).load()
+    assert [c.rule for c in other.conventions] == ["snake_case"]
+
+
+def _count_writes(monkeypatch: pytest.MonkeyPatch, manager: ContextManager) -> list[bytes]:
+    writes: list[bytes] = []
+    original = manager._write_context
+
+    def record(data: bytes) -> None:
+        writes.append(data)
+        original(data)
+
+    monkeypatch.setattr(manager, "_write_context", record)
+    return writes
+
+
+def test_nested_batch_writes_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _write_context(tmp_path)
+    manager = ContextManager(tmp_path)
+    writes = _count_writes(monkeypatch, manager)
+
+    with manager.batch():
+        manager.add_convention("testing", "pytest")
+        with manager.batch():
+            manager.add_note("nested")
+            manager.add_change("Batched change")
+            manager.update_overview("Batched overview.")
+        assert writes == []
+
+    assert len(writes) == 1
+    saved = ContextManager(tmp_path).load()
+    assert saved.overview == "Batched overview."
+    assert [c.rule for c in saved.conventions] == ["snake_case", "pytest"]
+    assert any("nested" in note for note in saved.notes)
+    assert "Batched change" in [c.summary for c in saved.changelog]
+
+
+def test_batch_saves_when_block_raises(tmp_path: Path) -> None:
+    _write_context(tmp_path)
+    manager = ContextManager(tmp_path)
+
+    with pytest.raises(RuntimeError), manager.batch():
+        manager.update_overview("Saved anyway.")
+        raise RuntimeError("boom")
+
+    assert ContextManager(tmp_path).load().overview == "Saved anyway."
+
+
+def test_save_with_context_inside_batch(tmp_path: Path) -> None:
+    manager = ContextManager(tmp_path)
+
+    with manager.batch():
+        manager.save(ProjectContext(overview="Passed in."))
+        assert not manager.exists()
+
+    assert manager.context.overview == "Passed in."
+    assert ContextManager(tmp_path).load().overview == "Passed in."
+
+
+def test_load_sees_same_size_edit_with_new_mtime(tmp_path: Path) -> None:
+    _write_context(tmp_path)
+    manager = ContextManager(tmp_path)
+    assert manager.load().overview == "A demo project."
+
+    path = manager.context_path
+    st = path.stat()
+    path.write_text(path.read_text().replace("A demo project.", "A test project."))
+    assert path.stat().st_size == st.st_size
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert ContextManager(tmp_path).load().overview == "A test project."
+
+
+def test_load_after_delete_returns_empty_context(tmp_path: Path) -> None:
+    _write_context(tmp_path)
+    ContextManager(tmp_path).load()
+
+    (tmp_path / ".kira" / "context.md").unlink()
+
+    assert ContextManager(tmp_path).load().overview == ""
+
+
+class _FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2024, 2, 3, 4, 5)
+
+
+def test_spliced_change_only_inserts_the_entry(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(manager_module, "datetime", _FixedDatetime)
+    _write_context(tmp_path)
+    manager = ContextManager(tmp_path)
+    before = manager.context_path.read_text()
+
+    entry = manager.add_change("Second change", details=["more"], change_type=ChangeType.BUGFIX)
+
+    # The rest of the file, including entry times a full re-render would
+    # drop, is left as it was
+    marker = "\n## Recent Changes\n\n"
+    head, _, tail = before.partition(marker)
+    assert manager.context_path.read_text() == f"{head}{marker}{entry.to_markdown()}\n\n{tail}"
+    assert [c.summary for c in ContextManager(tmp_path).load().changelog] == [
+        "Second change",
+        "Initial import",
+    ]
+
+
+def test_change_outside_recent_window_falls_back_to_save(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _write_context(tmp_path)
+    manager = ContextManager(tmp_path)
+    writes = _count_writes(monkeypatch, manager)
+    # An older entry does not sort first, so it cannot be spliced in at the top
+    manager.context.changelog[0].date = datetime(2999, 1, 1)
+
+    manager.add_change("Older change")
+
+    assert len(writes) == 1
+    assert writes[0] == manager._generate_markdown(manager.context).encode()
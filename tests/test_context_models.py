@@ -0,0 +1,25 @@
+"""Tests for the project context data models."""
+
+from __future__ import annotations
+
+from kira.context.models import Convention, KnownIssue, ProjectContext, TechStack
+
+
+def test_prompt_context_reflects_field_changes() -> None:
+    ctx = ProjectContext(name="demo", overview="Old overview.")
+    first = ctx.to_prompt_context()
+    assert "Old overview." in first
+
+    # Direct assignment and in-place mutation, as /context refresh does
+    ctx.overview = "New overview."
+    ctx.tech_stack = TechStack(languages=["Python"])
+    ctx.tech_stack.frameworks.append("FastAPI")
+    ctx.conventions.append(Convention(category="naming", rule="snake_case"))
+    ctx.known_issues.append(KnownIssue(description="Flaky test", severity="warning"))
+
+    second = ctx.to_prompt_context()
+    assert "Old overview." not in second
+    assert "New overview." in second
+    assert "**Frameworks:** FastAPI" in second
+    assert "- **naming:** snake_case" in second
+    assert "- [warning] Flaky test" in second
@@ -0,0 +1,58 @@
+"""Tests for model alias resolution and lookup."""
+
+from __future__ import annotations
+
+import pytest
+
+from kira.core import models
+from kira.core.models import (
+    ModelInfo,
+    get_model_info,
+    get_tier,
+    refresh_models,
+    resolve_model,
+)
+
+
+@pytest.fixture(autouse=True)
+def fallback_models():
+    """Run each test against the built-in fallback model list."""
+    refresh_models()
+    yield
+    refresh_models()
+
+
+def test_aliases_resolve_to_latest_of_each_family() -> None:
+    assert resolve_model("fast") == "claude-haiku-4.5"
+    assert resolve_model("SMART") == "claude-sonnet-4.5"
+    assert resolve_model("best") == "claude-opus-4.5"
+    assert resolve_model("some-other-model") == "some-other-model"
+    assert resolve_model(None) is None
+
+
+def test_lookups_are_case_insensitive() -> None:
+    info = get_model_info("Claude-Opus-4.5")
+    assert info is not None
+    assert info.name == "claude-opus-4.5"
+    assert get_tier("haiku") == "fast"
+    assert get_model_info("missing") is None
+
+
+def test_refresh_models_drops_memoized_lookups(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Populate the memoized lookups from the fallback list
+    assert resolve_model("fast") == "claude-haiku-4.5"
+    assert get_model_info("fast") is not None
+
+    newer = ModelInfo(
+        name="claude-haiku-5",
+        display_name="Claude Haiku 5",
+        tier="fast",
+        description="A newer Haiku",
+    )
+    monkeypatch.setattr(models, "_fetch_models_from_kiro", lambda: [newer])
+    refresh_models()
+
+    assert resolve_model("fast") == "claude-haiku-5"
+    assert get_model_info("fast") is newer
+    assert get_tier("fast") == "fast"
+    assert resolve_model("best") == "best"
@@ -0,0 +1,112 @@
+"""Tests for SmartContextLoader file lookup, content search and previews."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from kira.context import smart
+from kira.context.smart import SmartContextLoader
+
+_real_run = subprocess.run
+
+
+def _write(path: Path, text: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    _write(tmp_path / "app" / "auth.py", "def login_user(name):\n    return name\n")
+    _write(tmp_path / "app" / "views.py", "from app.auth import login_user\n")
+    _write(tmp_path / "web" / "index.js", "export function renderPage() {}\n")
+    _write(tmp_path / "README.md", "login_user is documented here\n")
+    _write(tmp_path / "app" / "empty.py")
+    return tmp_path
+
+
+def _fake_rg(monkeypatch: pytest.MonkeyPatch, calls: list[list[str]], returncode: int | None):
+    """Route ``rg`` calls to a stub; None means ripgrep is not installed."""
+
+    def run(cmd, *args, **kwargs):
+        if cmd[0] != "rg":
+            return _real_run(cmd, *args, **kwargs)
+        calls.append(cmd)
+        if returncode is None:
+            raise FileNotFoundError("rg")
+        return subprocess.CompletedProcess(cmd, returncode, stdout="", stderr="")
+
+    monkeypatch.setattr(smart.subprocess, "run", run)
+
+
+def test_index_is_rebuilt_for_each_load(project: Path) -> None:
+    loader = SmartContextLoader(project)
+    assert loader.load("look at widget.py").matches == []
+
+    # Added below the root, so the root directory's mtime does not change
+    _write(project / "app" / "widget.py", "WIDGET = 1\n")
+
+    assert [m.path.name for m in loader.load("look at widget.py").matches] == ["widget.py"]
+
+
+def test_rg_no_match_skips_fallback_scan(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[list[str]] = []
+    _fake_rg(monkeypatch, calls, returncode=1)
+    loader = SmartContextLoader(project)
+    monkeypatch.setattr(loader, "_scan_files", lambda patterns: pytest.fail("scanned"))
+
+    assert list(loader._search_candidates(["login_user"])) == []
+    assert len(calls) == 1
+    assert "--max-count=10" not in calls[0]
+
+
+@pytest.mark.parametrize("returncode", [None, 2])
+def test_rg_missing_or_failing_falls_back_to_scan(
+    project: Path, monkeypatch: pytest.MonkeyPatch, returncode: int | None
+) -> None:
+    _fake_rg(monkeypatch, [], returncode=returncode)
+    loader = SmartContextLoader(project)
+
+    found = list(loader._search_candidates(["login_user"]))
+
+    # Only .py/.js/.ts files are scanned; the empty file is skipped
+    assert sorted(p.relative_to(project).as_posix() for p in found) == [
+        "app/auth.py",
+        "app/views.py",
+    ]
+
+
+def test_scan_matches_any_pattern(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _fake_rg(monkeypatch, [], returncode=None)
+    loader = SmartContextLoader(project)
+
+    results = loader._grep_many(["renderPage", "def login_user"])
+
+    assert [p.name for p in results["renderPage"]] == ["index.js"]
+    assert [p.name for p in results["def login_user"]] == ["auth.py"]
+
+
+def test_load_finds_function_without_ripgrep(
+    project: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _fake_rg(monkeypatch, [], returncode=None)
+
+    context = SmartContextLoader(project).load("why does login_user( fail?")
+
+    assert context.matches[0].path == project / "app" / "auth.py"
+    assert "def login_user" in context.matches[0].preview
+
+
+def test_preview_sees_file_edits(project: Path) -> None:
+    loader = SmartContextLoader(project)
+    path = project / "app" / "auth.py"
+    assert "return name" in loader._get_preview(path, "login_user")
+
+    path.write_text("def login_user(name, password):\n    return check(password)\n")
+
+    preview = loader._get_preview(path, "login_user")
+    assert "check(password)" in preview
+    assert "return name" not in preview